@@ -65,6 +65,18 @@ from pathlib import Path
 from collections import Counter, defaultdict
 from typing import List, Dict, Any
 
+# Use orjson for faster JSONL parsing when available
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    # Fallback to standard json
+    json_loads = json.loads
+
+# Log levels treated as errors
+ERROR_LEVELS = frozenset({"ERROR", "CRITICAL"})
+
 
 class LogAnalyzer:
     """
@@ -95,6 +107,8 @@ class LogAnalyzer:
         self.log_file = log_file
         self.entries: List[Dict[str, Any]] = []
         self.classifier = ErrorPatternClassifier()
+        # analyze_patterns() result, computed on first use
+        self._patterns: dict[str, Any] | None = None
         self._load_logs()
 
     def _load_logs(self) -> None:
@@ -107,19 +121,25 @@ class LogAnalyzer:
         if not self.log_file.exists():
             return
 
-        with self.log_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-                    self.entries.append(entry)
-                except json.JSONDecodeError:
-                    # Skip corrupted lines
-                    continue
+        # Read the whole file at once and parse it line by line
+        for line in self.log_file.read_bytes().split(b"\n"):
+            if not line.strip():
+                continue
+            try:
+                self.entries.append(json_loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # Skip corrupted lines (orjson's error subclasses JSONDecodeError)
+                continue
 
     def analyze_patterns(self) -> Dict[str, Any]:
         """
         Analyze log entries to detect patterns.
 
+        The analysis runs once per analyzer, since entries are only loaded
+        when the analyzer is created; entries must be treated as read-only
+        after construction. Each call returns a fresh copy of the
+        result containers, so callers may modify what they get back.
+
         Returns:
             Dictionary containing:
             - error_patterns: Dict of error messages to list of entries
@@ -127,31 +147,51 @@ class LogAnalyzer:
             - agent_activities: Count of activities per agent
             - total_entries: Total number of log entries
         """
+        patterns = self._analyzed_patterns()
+        return {
+            "error_patterns": {
+                message: list(entries)
+                for message, entries in patterns["error_patterns"].items()
+            },
+            "operation_counts": dict(patterns["operation_counts"]),
+            "agent_activities": dict(patterns["agent_activities"]),
+            "total_entries": patterns["total_entries"],
+        }
+
+    def _analyzed_patterns(self) -> Dict[str, Any]:
+        """
+        Shared analyze_patterns() result, computed on first use.
+
+        Used internally for read-only access without copying; it must not
+        be modified or handed to callers.
+        """
+        if self._patterns is not None:
+            return self._patterns
+
         error_patterns = defaultdict(list)
-        operation_counts = Counter()
-        agent_activities = defaultdict(list)
+        operations = []
+        agents = []
 
         for entry in self.entries:
             # Collect error patterns
-            level = entry.get("level")
-            if level in ["ERROR", "CRITICAL"]:
-                message = entry.get("message", "Unknown")
-                error_patterns[message].append(entry)
+            if entry.get("level") in ERROR_LEVELS:
+                error_patterns[entry.get("message", "Unknown")].append(entry)
 
-            # Count operations
-            operation = entry.get("metadata", {}).get("operation", "unknown")
-            operation_counts[operation] += 1
-
-            # Track agent activities
-            agent = entry.get("context", {}).get("agent", "unknown")
-            agent_activities[agent].append(entry)
+            # Collect operations and agents, counted in one pass below
+            metadata = entry.get("metadata")
+            operations.append(
+                metadata.get("operation", "unknown") if metadata else "unknown"
+            )
+            context = entry.get("context")
+            agents.append(context.get("agent", "unknown") if context else "unknown")
 
-        return {
+        self._patterns = {
             "error_patterns": dict(error_patterns),
-            "operation_counts": dict(operation_counts),
-            "agent_activities": {k: len(v) for k, v in agent_activities.items()},
+            "operation_counts": dict(Counter(operations)),
+            "agent_activities": dict(Counter(agents)),
             "total_entries": len(self.entries),
         }
+        return self._patterns
 
     def generate_insights(self) -> List[str]:
         """
@@ -166,13 +206,12 @@ class LogAnalyzer:
             List of insight strings with emoji indicators
         """
         insights = []
-        patterns = self.analyze_patterns()
+        patterns = self._analyzed_patterns()
 
-        # Error rate analysis
-        error_count = sum(
-            1 for e in self.entries if e.get("level") in ["ERROR", "CRITICAL"]
-        )
-        error_rate = (error_count / len(self.entries) * 100) if self.entries else 0
+        # Error rate analysis (error_patterns holds every ERROR/CRITICAL entry)
+        error_count = sum(map(len, patterns["error_patterns"].values()))
+        total_entries = patterns["total_entries"]
+        error_rate = (error_count / total_entries * 100) if total_entries else 0
 
         if error_rate > 10:
             insights.append(f"⚠️ High error rate detected: {error_rate:.1f}%")
@@ -204,7 +243,7 @@ class LogAnalyzer:
         categorized = defaultdict(list)
 
         for entry in self.entries:
-            if entry.get("level") in ["ERROR", "CRITICAL"]:
+            if entry.get("level") in ERROR_LEVELS:
                 message = entry.get("message", "Unknown")
                 category = self.classifier.classify(message)
                 categorized[category].append(entry)
@@ -219,7 +258,7 @@ class LogAnalyzer:
             Dictionary with error counts, categories, and top patterns
         """
         categorized = self.categorize_errors()
-        patterns = self.analyze_patterns()
+        patterns = self._analyzed_patterns()
 
         # Get top 5 most frequent error patterns
         error_freq = {
@@ -9,12 +9,22 @@ import os
 import sys
 import json
 import warnings
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 import uuid
 
+# Use orjson for faster JSONL loading when available
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 # Suppress sklearn warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
 
@@ -1526,27 +1536,88 @@ def create_ai_analyzer(metrics_dir: str = None) -> AIPerformanceAnalyzer:
 
 
 def analyze_performance_data(
-    metrics_file: str, metrics_dir: str = None
+    metrics_file: str, metrics_dir: str = None, days: Optional[int] = None
 ) -> Dict[str, Any]:
-    """Analyze performance data from a metrics file"""
+    """Analyze performance data from a metrics file
+
+    When days is given, only records from the last ``days`` days are loaded;
+    records whose timestamp is missing or cannot be parsed are kept.
+    """
     analyzer = AIPerformanceAnalyzer(metrics_dir)
 
-    # Load data
-    data = []
-    with open(metrics_file, "r") as f:
-        for line in f:
-            try:
-                data.append(json.loads(line.strip()))
-            except:
-                continue
+    since = (
+        datetime.now(timezone.utc) - timedelta(days=days) if days is not None else None
+    )
 
-    if not data:
+    # Stream records straight into columns; pandas skips per-row inference
+    # for dict-of-lists and the full row list is never materialized
+    columns: Dict[str, List[Any]] = {}
+    rows = 0
+    for record in _iter_jsonl_records(metrics_file):
+        if since is not None and not _is_recent(record, since):
+            continue
+
+        for key, value in record.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * rows
+            column.append(value)
+        rows += 1
+
+        # Pad columns this record did not have
+        if len(record) != len(columns):
+            for column in columns.values():
+                if len(column) < rows:
+                    column.append(None)
+
+    if not rows:
         return {"error": "No valid data found in metrics file"}
 
-    df = pd.DataFrame(data)
+    df = pd.DataFrame(columns)
     return analyzer.analyze_metrics(df)
 
 
+def _is_recent(record: Dict[str, Any], since: datetime) -> bool:
+    """Check whether a record's ISO timestamp falls at or after since
+
+    Records without a parseable timestamp count as recent, so filtering by
+    age never drops data it cannot date.
+    """
+    try:
+        timestamp = datetime.fromisoformat(record["timestamp"])
+    except (KeyError, TypeError, ValueError):
+        return True
+
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp >= since
+
+
+def _iter_jsonl_records(metrics_file: str):
+    """Yield JSON object records from a JSONL file, reporting skipped lines"""
+    with open(metrics_file, "rb") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = _json_loads(line)
+            except (_JSONDecodeError, ValueError) as e:
+                print(
+                    f"Warning: Skipping malformed line {line_number} in {metrics_file}: {e}",
+                    file=sys.stderr,
+                )
+                continue
+
+            if not isinstance(record, dict):
+                print(
+                    f"Warning: Skipping non-object line {line_number} in {metrics_file}",
+                    file=sys.stderr,
+                )
+                continue
+
+            yield record
+
+
 if __name__ == "__main__":
     # CLI interface
     import argparse
@@ -1560,7 +1631,10 @@ if __name__ == "__main__":
     parser.add_argument("--metrics-dir", default=None, help="Metrics directory path")
     parser.add_argument("--metrics-file", help="Specific metrics file to analyze")
     parser.add_argument(
-        "--days", type=int, default=7, help="Number of days for analysis"
+        "--days",
+        type=int,
+        default=None,
+        help="Number of days for analysis (report: default 7; analyze: all records)",
     )
     parser.add_argument("--output", help="Output file for results")
 
@@ -1576,7 +1650,9 @@ if __name__ == "__main__":
 
     if args.command == "analyze":
         if args.metrics_file:
-            results = analyze_performance_data(args.metrics_file, args.metrics_dir)
+            results = analyze_performance_data(
+                args.metrics_file, args.metrics_dir, args.days
+            )
         else:
             print("Error: --metrics-file required for analyze command")
             sys.exit(1)
@@ -1589,7 +1665,9 @@ if __name__ == "__main__":
             print(json.dumps(results, indent=2, default=str))
 
     elif args.command == "report":
-        report = analyzer.generate_performance_report(args.days)
+        report = analyzer.generate_performance_report(
+            args.days if args.days is not None else 7
+        )
 
         if args.output:
             with open(args.output, "w") as f:
@@ -8,14 +8,97 @@ import os
 import sys
 import time
 import json
+import atexit
 import psutil
 import threading
+import types
+import weakref
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Dict, Any, Union
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 from contextlib import contextmanager
-import uuid
+from functools import lru_cache
+from itertools import count, islice
+
+# Bound once so timestamp formatting skips the timezone.utc attribute lookups
+_UTC = timezone.utc
+
+# Process-local ID sequences; the pid prefix keeps IDs distinct across processes
+_ID_PREFIX = str(os.getpid())
+_operation_ids = count(1)
+_switch_ids = count(1)
+
+# Seconds between background flushes of a MetricsClient's buffers
+_FLUSH_INTERVAL = 5
+
+# Clients not yet closed; held weakly so unused clients can be collected
+_open_clients = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_clients():
+    """Flush and close every client still open at interpreter exit"""
+    for client in list(_open_clients):
+        client.close()
+
+
+def _flush_periodically(client_ref, stop: threading.Event):
+    """Flush a client until it is closed or garbage collected
+
+    Only a weak reference is held between flushes, so the thread does not
+    keep an otherwise unused client alive.
+    """
+    while not stop.wait(_FLUSH_INTERVAL):
+        client = client_ref()
+        if client is None:
+            return
+        client.flush()
+        del client
+
+
+# Sections a useful handover document is expected to mention (lowercase)
+_HANDOVER_SECTIONS = ("context", "status", "next", "priority")
+
+
+# File analyses are cached by (path, st_mtime_ns, st_size), so an edited file
+# is read again. The caches are module-level because the convenience
+# functions create a new tracker for every call; lru_cache is also safe to
+# use from the hook and flush threads at once.
+@lru_cache(maxsize=16)
+def _notes_counts(notes_path: str, mtime_ns: int, size: int) -> tuple:
+    """(lines, words) of a version of a notes file"""
+    with open(notes_path, "r", encoding="utf-8") as f:
+        content = f.read()
+    return len(content.splitlines()), len(content.split())
+
+
+@lru_cache(maxsize=16)
+def _handover_quality(handover_path: str, mtime_ns: int, size: int) -> float:
+    """Quality score (0-1) of a version of a handover document"""
+    try:
+        with open(handover_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except Exception:
+        return 0.0
+
+    # Quality heuristics
+    quality_score = 0.0
+
+    # Check for essential sections, lowercasing the content only once
+    content_lower = content.lower()
+    sections_found = sum(
+        1 for section in _HANDOVER_SECTIONS if section in content_lower
+    )
+    quality_score += (sections_found / len(_HANDOVER_SECTIONS)) * 0.5
+
+    # Check content richness
+    words = len(content.split())
+    if words > 50:  # Reasonable amount of information
+        quality_score += 0.3
+    if words > 100:  # Rich information
+        quality_score += 0.2
+
+    return min(1.0, quality_score)
 
 
 # Memory Bank operations monitoring
@@ -23,11 +106,13 @@ class MemoryBankMonitor:
     def __init__(self, metrics_client):
         self.metrics_client = metrics_client
         self.operation_cache = deque(maxlen=1000)
+        # Efficiency scores of the last 10 operations, kept alongside the cache
+        self.efficiency_window = deque(maxlen=10)
 
     @contextmanager
     def track_operation(self, operation_type: str, file_path: str = None):
         """Track Memory Bank operation with comprehensive metrics"""
-        operation_id = str(uuid.uuid4())
+        operation_id = f"{_ID_PREFIX}-op-{next(_operation_ids)}"
         start_time = time.time()
         start_memory = psutil.Process().memory_info().rss
         start_cpu_times = psutil.Process().cpu_times()
@@ -61,24 +146,19 @@ class MemoryBankMonitor:
                 - start_cpu_times.system
             )
 
-            # File size analysis if path provided
-            file_metrics = {}
-            if file_path and os.path.exists(file_path):
-                stat = os.stat(file_path)
-                file_metrics = {
-                    "file_size_bytes": stat.st_size,
-                    "file_size_category": self._categorize_file_size(stat.st_size),
-                    "file_age_seconds": time.time() - stat.st_mtime,
-                }
-
-            # Emit detailed metrics
+            # Emit detailed metrics (tags are shared by reference, not mutated after)
             tags = {
                 "operation": operation_type,
                 "success": success,
                 "error_type": error_type or "none",
-                **file_metrics,
             }
 
+            # File size analysis if path provided (most operations have none)
+            file_metrics = {}
+            if file_path:
+                file_metrics = self._get_file_metrics(file_path)
+                tags.update(file_metrics)
+
             self.metrics_client.emit_metric(
                 "memory_bank.operation.duration_ms", duration * 1000, tags
             )
@@ -103,9 +183,27 @@ class MemoryBankMonitor:
                 }
             )
 
+            # Simple efficiency calculation: operation value vs resource cost
+            self.efficiency_window.append(
+                1.0 / (duration + memory_delta / (1024 * 1024 * 100))
+            )
+
             # Analyze for performance patterns
             self._analyze_operation_patterns()
 
+    def _get_file_metrics(self, file_path: str) -> Dict[str, Any]:
+        """Get size and age metrics for the operation's file, if it exists"""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return {}
+
+        return {
+            "file_size_bytes": stat.st_size,
+            "file_size_category": self._categorize_file_size(stat.st_size),
+            "file_age_seconds": time.time() - stat.st_mtime,
+        }
+
     def _categorize_file_size(self, size_bytes: int) -> str:
         """Categorize file size for metrics grouping"""
         if size_bytes < 1024:
@@ -121,46 +219,44 @@ class MemoryBankMonitor:
 
     def _analyze_operation_patterns(self):
         """Analyze recent operations for performance patterns"""
-        if len(self.operation_cache) < 10:
+        efficiency_scores = self.efficiency_window
+        if len(efficiency_scores) < 10:
             return
 
-        recent_ops = list(self.operation_cache)[-10:]
-
-        # Calculate operation efficiency trends
-        efficiency_scores = []
-        for op in recent_ops:
-            # Simple efficiency calculation: operation value vs resource cost
-            efficiency = 1.0 / (
-                op["duration"] + op["memory_delta"] / (1024 * 1024 * 100)
-            )
-            efficiency_scores.append(efficiency)
-
         # Detect efficiency degradation
-        if len(efficiency_scores) >= 5:
-            recent_avg = sum(efficiency_scores[-5:]) / 5
-            older_avg = sum(efficiency_scores[-10:-5]) / 5
+        older_avg = sum(islice(efficiency_scores, 0, 5)) / 5
+        recent_avg = sum(islice(efficiency_scores, 5, 10)) / 5
 
-            degradation_ratio = (
-                (older_avg - recent_avg) / older_avg if older_avg > 0 else 0
-            )
+        degradation_ratio = (older_avg - recent_avg) / older_avg if older_avg > 0 else 0
 
-            if degradation_ratio > 0.2:  # 20% degradation
-                self.metrics_client.emit_alert(
-                    "memory_bank_efficiency_degradation",
-                    {
-                        "degradation_ratio": degradation_ratio,
-                        "recent_operations": recent_ops[-5:],
-                        "severity": "warning"
-                        if degradation_ratio < 0.4
-                        else "critical",
-                    },
-                )
+        if degradation_ratio > 0.2:  # 20% degradation
+            # Only materialize the operation records when an alert is raised
+            cache_size = len(self.operation_cache)
+            recent_ops = list(islice(self.operation_cache, cache_size - 5, cache_size))
+            self.metrics_client.emit_alert(
+                "memory_bank_efficiency_degradation",
+                {
+                    "degradation_ratio": degradation_ratio,
+                    "recent_operations": recent_ops,
+                    "severity": "warning" if degradation_ratio < 0.4 else "critical",
+                },
+            )
 
 
 class HookExecutionTracker:
     def __init__(self, metrics_client):
         self.metrics_client = metrics_client
-        self.hook_history = defaultdict(list)
+        # Recent history (last 100 executions per hook)
+        self.hook_history = defaultdict(lambda: deque(maxlen=100))
+        # Rolling duration windows with incrementally maintained sums
+        self.duration_stats = defaultdict(
+            lambda: {
+                "sum50": 0.0,
+                "sum10": 0.0,
+                "ring50": deque(maxlen=50),
+                "ring10": deque(maxlen=10),
+            }
+        )
 
     @contextmanager
     def track_hook_execution(self, hook_name: str, operation: str):
@@ -205,6 +301,7 @@ class HookExecutionTracker:
             )
 
             # Track hook execution history for performance analysis
+            self._update_duration_stats(hook_name, duration)
             self.hook_history[hook_name].append(
                 {
                     "timestamp": end_time,
@@ -214,10 +311,6 @@ class HookExecutionTracker:
                 }
             )
 
-            # Keep only recent history (last 100 executions per hook)
-            if len(self.hook_history[hook_name]) > 100:
-                self.hook_history[hook_name] = self.hook_history[hook_name][-100:]
-
             # Analyze hook performance trends
             self._analyze_hook_performance(hook_name)
 
@@ -247,24 +340,31 @@ class HookExecutionTracker:
             "time_delta": time_delta,
         }
 
+    def _update_duration_stats(self, hook_name: str, duration: float):
+        """Advance the rolling duration windows, keeping their sums in step"""
+        stats = self.duration_stats[hook_name]
+        for ring_key, sum_key in (("ring50", "sum50"), ("ring10", "sum10")):
+            ring = stats[ring_key]
+            if len(ring) == ring.maxlen:
+                stats[sum_key] -= ring[0]
+            ring.append(duration)
+            stats[sum_key] += duration
+
     def _analyze_hook_performance(self, hook_name: str):
         """Analyze hook performance trends and detect anomalies"""
-        history = self.hook_history[hook_name]
-        if len(history) < 10:
+        stats = self.duration_stats[hook_name]
+        if len(stats["ring10"]) < 10:
             return
 
-        recent_executions = history[-10:]
-
-        # Calculate performance baseline
-        durations = [h["duration"] for h in history[-50:]]  # Last 50 executions
-        avg_duration = sum(durations) / len(durations)
+        # Performance baseline over the last 50 executions
+        avg_duration = stats["sum50"] / len(stats["ring50"])
 
         # Detect performance anomalies
-        recent_avg = sum(h["duration"] for h in recent_executions) / len(
-            recent_executions
-        )
+        recent_avg = stats["sum10"] / len(stats["ring10"])
 
         if recent_avg > avg_duration * 1.5:  # 50% slower than baseline
+            history = self.hook_history[hook_name]
+            recent_executions = list(islice(history, len(history) - 10, len(history)))
             self.metrics_client.emit_alert(
                 "hook_performance_degradation",
                 {
@@ -286,7 +386,7 @@ class AgentSwitchPerformanceTracker:
     @contextmanager
     def track_agent_switch(self, from_agent: str, to_agent: str):
         """Track agent switching performance and quality"""
-        switch_id = str(uuid.uuid4())
+        switch_id = f"{_ID_PREFIX}-switch-{next(_switch_ids)}"
         start_time = time.time()
 
         # Pre-switch context analysis
@@ -360,33 +460,40 @@ class AgentSwitchPerformanceTracker:
         context_info = {}
 
         # Analyze agent notes file
-        notes_path = Path(f".claude/{agent}/notes.md")
-        if notes_path.exists():
-            stat = notes_path.stat()
-            context_info["notes_size"] = stat.st_size
-            context_info["notes_modified"] = stat.st_mtime
-
-            # Count recent activity
-            with open(notes_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                context_info["notes_lines"] = len(content.splitlines())
-                context_info["notes_words"] = len(content.split())
+        notes_path = f".claude/{agent}/notes.md"
+        context_info.update(self._notes_metrics(notes_path))
 
         # Analyze active task state
-        active_file = Path(".claude/agents/active.json")
-        if active_file.exists():
-            try:
-                with open(active_file, "r") as f:
-                    active_data = json.load(f)
-                    context_info["active_agent"] = active_data.get("agent", "unknown")
-                    context_info["session_duration"] = time.time() - active_data.get(
-                        "started_at", time.time()
-                    )
-            except:
-                pass
+        # (a missing file is handled by open() rather than a separate exists())
+        active_file = ".claude/agents/active.json"
+        try:
+            with open(active_file, "r") as f:
+                active_data = json.load(f)
+                context_info["active_agent"] = active_data.get("agent", "unknown")
+                context_info["session_duration"] = time.time() - active_data.get(
+                    "started_at", time.time()
+                )
+        except:
+            pass
 
         return context_info
 
+    def _notes_metrics(self, notes_path: str) -> Dict[str, Any]:
+        """Get notes file metrics, re-reading the file only when it changed"""
+        try:
+            stat = os.stat(notes_path)
+        except FileNotFoundError:
+            return {}
+
+        # Count recent activity
+        lines, words = _notes_counts(notes_path, stat.st_mtime_ns, stat.st_size)
+        return {
+            "notes_size": stat.st_size,
+            "notes_modified": stat.st_mtime,
+            "notes_lines": lines,
+            "notes_words": words,
+        }
+
     def _analyze_post_switch_context(self, agent: str) -> Dict[str, Any]:
         """Analyze context after agent switch"""
         # Similar to pre-switch but captures the new agent's state
@@ -408,68 +515,39 @@ class AgentSwitchPerformanceTracker:
 
     def _analyze_handover_quality(self) -> Dict[str, Any]:
         """Analyze handover file quality"""
-        handover_path = Path(".claude/shared/handover-interrupt-template.md")
-
-        if not handover_path.exists():
-            return {"size": 0, "quality": 0.0}
-
-        stat = handover_path.stat()
-        size = stat.st_size
+        handover_path = ".claude/shared/handover-interrupt-template.md"
 
-        # Analyze handover content quality
         try:
-            with open(handover_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Quality heuristics
-            quality_score = 0.0
-
-            # Check for essential sections
-            essential_sections = ["context", "status", "next", "priority"]
-            sections_found = sum(
-                1
-                for section in essential_sections
-                if section.lower() in content.lower()
-            )
-            quality_score += (sections_found / len(essential_sections)) * 0.5
-
-            # Check content richness
-            words = len(content.split())
-            if words > 50:  # Reasonable amount of information
-                quality_score += 0.3
-            if words > 100:  # Rich information
-                quality_score += 0.2
-
-            quality_score = min(1.0, quality_score)
-
-        except Exception:
-            quality_score = 0.0
+            stat = os.stat(handover_path)
+        except FileNotFoundError:
+            return {"size": 0, "quality": 0.0}
 
-        return {"size": size, "quality": quality_score}
+        quality = _handover_quality(handover_path, stat.st_mtime_ns, stat.st_size)
+        return {"size": stat.st_size, "quality": quality}
 
     def _analyze_switching_patterns(self, from_agent: str, to_agent: str):
         """Analyze agent switching patterns for optimization opportunities"""
         if len(self.switch_history) < 20:
             return
 
-        recent_switches = list(self.switch_history)[-20:]
+        history_size = len(self.switch_history)
+        recent_switches = list(islice(self.switch_history, history_size - 20, None))
 
         # Analyze switching frequency
-        switch_pairs = defaultdict(int)
-        total_duration = 0
-
-        for switch in recent_switches:
-            pair = f"{switch['from_agent']}->{switch['to_agent']}"
-            switch_pairs[pair] += 1
-            total_duration += switch["duration"]
+        switch_pairs = Counter(
+            f"{switch['from_agent']}->{switch['to_agent']}"
+            for switch in recent_switches
+        )
+        total_duration = sum(switch["duration"] for switch in recent_switches)
 
         # Detect inefficient switching patterns
         avg_duration = total_duration / len(recent_switches)
-        frequent_switches = [
-            (pair, count)
-            for pair, count in switch_pairs.items()
-            if count > len(recent_switches) * 0.3
-        ]  # More than 30% of switches
+        threshold = len(recent_switches) * 0.3  # More than 30% of switches
+        frequent_switches = []
+        for pair, n in switch_pairs.most_common():
+            if n <= threshold:
+                break
+            frequent_switches.append((pair, n))
 
         if (
             frequent_switches and avg_duration > 5.0
@@ -486,6 +564,31 @@ class AgentSwitchPerformanceTracker:
             )
 
 
+# Baseline energy consumption (Wh) for different operations
+_ENERGY_BASELINES = types.MappingProxyType(
+    {
+        "file_read": 0.001,
+        "file_write": 0.002,
+        "json_parse": 0.001,
+        "agent_switch": 0.005,
+        "tdd_cycle": 0.010,
+        "hook_execution": 0.003,
+    }
+)
+
+# Efficiency improvement recommendations per operation type
+_EFFICIENCY_RECOMMENDATIONS = types.MappingProxyType(
+    {
+        "file_read": "Consider caching frequently accessed files",
+        "file_write": "Batch multiple write operations when possible",
+        "json_parse": "Cache parsed JSON objects for reuse",
+        "agent_switch": "Optimize handover templates to reduce processing",
+        "tdd_cycle": "Optimize test execution order and parallel testing",
+        "hook_execution": "Review hook complexity and optimize critical paths",
+    }
+)
+
+
 class GreenComputingMonitor:
     def __init__(self, metrics_client):
         self.metrics_client = metrics_client
@@ -562,33 +665,14 @@ class GreenComputingMonitor:
         self, operation_type: str, energy_wh: float
     ) -> float:
         """Calculate operation efficiency score"""
-        # Define baseline energy consumption for different operations
-        baselines = {
-            "file_read": 0.001,
-            "file_write": 0.002,
-            "json_parse": 0.001,
-            "agent_switch": 0.005,
-            "tdd_cycle": 0.010,
-            "hook_execution": 0.003,
-        }
-
-        baseline = baselines.get(operation_type, 0.005)
+        baseline = _ENERGY_BASELINES.get(operation_type, 0.005)
         efficiency = min(1.0, baseline / max(energy_wh, 0.0001))
 
         return efficiency
 
     def _get_efficiency_recommendation(self, operation_type: str) -> str:
         """Get efficiency improvement recommendations"""
-        recommendations = {
-            "file_read": "Consider caching frequently accessed files",
-            "file_write": "Batch multiple write operations when possible",
-            "json_parse": "Cache parsed JSON objects for reuse",
-            "agent_switch": "Optimize handover templates to reduce processing",
-            "tdd_cycle": "Optimize test execution order and parallel testing",
-            "hook_execution": "Review hook complexity and optimize critical paths",
-        }
-
-        return recommendations.get(
+        return _EFFICIENCY_RECOMMENDATIONS.get(
             operation_type,
             "Review operation implementation for optimization opportunities",
         )
@@ -601,11 +685,21 @@ class EnergyTracker:
         self.baseline_measured = False
         self.baseline_power = 0
 
+        # Prime psutil's CPU delta baseline so later reads need not block
+        try:
+            psutil.cpu_percent(interval=None)
+        except Exception:
+            pass
+
     def get_current_power_usage(self) -> float:
-        """Get current estimated power usage"""
+        """Get current estimated power usage
+
+        CPU usage is measured non-blocking, relative to the previous call
+        (or to construction), so the first reading may be 0.0.
+        """
         try:
             # Use psutil to estimate power based on system resources
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory_info = psutil.virtual_memory()
 
             # Simplified power estimation
@@ -625,22 +719,39 @@ class MetricsClient:
         # Ensure output directory exists
         os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
 
-        # Initialize metrics buffer for batch writing
+        # Metrics can be switched off entirely via the environment
+        self.enabled = not os.environ.get("CLAUDE_METRICS_DISABLED")
+
+        # Initialize metrics and alerts buffers for batch writing
         self.metrics_buffer = []
+        self.alerts_buffer = []
         self.buffer_lock = threading.Lock()
 
-        # Start background flush thread
-        self.flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        # Long-lived append handles per output path, reopened after rotation
+        self._file_handles: Dict[str, Any] = {}
+        self.file_lock = threading.Lock()
+
+        # Start background flush thread; close() stops it, and clients still
+        # open at exit or when garbage collected are closed automatically
+        self._stop = threading.Event()
+        self.flush_thread = threading.Thread(
+            target=_flush_periodically,
+            args=(weakref.ref(self), self._stop),
+            daemon=True,
+        )
         self.flush_thread.start()
+        _open_clients.add(self)
 
     def emit_metric(
         self, metric_name: str, value: Union[int, float], tags: Dict[str, Any] = None
     ):
         """Emit a metric with optional tags"""
-        timestamp = datetime.now(timezone.utc).isoformat()
+        if not self.enabled:
+            return
 
+        # Epoch nanoseconds; converted to ISO format by the flush thread
         metric_entry = {
-            "timestamp": timestamp,
+            "timestamp": time.time_ns(),
             "metric": metric_name,
             "value": float(value),
             "tags": tags or {},
@@ -650,48 +761,171 @@ class MetricsClient:
         with self.buffer_lock:
             self.metrics_buffer.append(metric_entry)
 
+        # No flush thread runs after close(), so write straight away
+        if self._stop.is_set():
+            self._flush_metrics()
+
     def emit_alert(self, alert_type: str, alert_data: Dict[str, Any]):
-        """Emit an alert"""
-        timestamp = datetime.now(timezone.utc).isoformat()
+        """Emit an alert
 
-        alert_entry = {
-            "timestamp": timestamp,
-            "alert_type": alert_type,
-            "data": alert_data,
-            "source": "claude-friends-templates",
-        }
+        The alert is buffered and serialized by the flush thread, so it is
+        written within one flush interval (or on close()) rather than
+        immediately, and callers must not mutate alert_data afterwards.
+        """
+        if not self.enabled:
+            return
 
-        # Write alerts immediately (they're typically infrequent and important)
-        try:
-            with open(self.alerts_file, "a") as f:
-                f.write(json.dumps(alert_entry) + "\n")
-        except Exception as e:
-            print(f"Failed to write alert: {e}", file=sys.stderr)
+        with self.buffer_lock:
+            self.alerts_buffer.append((time.time_ns(), alert_type, alert_data))
 
-    def _flush_loop(self):
-        """Background thread to flush metrics buffer"""
-        while True:
-            time.sleep(5)  # Flush every 5 seconds
-            self._flush_metrics()
+        # No flush thread runs after close(), so write straight away
+        if self._stop.is_set():
+            self._flush_alerts()
+
+    def flush(self):
+        """Write all buffered metrics and alerts"""
+        self._flush_metrics()
+        self._flush_alerts()
 
     def _flush_metrics(self):
         """Flush metrics buffer to file"""
         if not self.metrics_buffer:
             return
 
+        # Swap in a fresh list so the lock is held only for the swap
         with self.buffer_lock:
-            metrics_to_write = self.metrics_buffer[:]
-            self.metrics_buffer.clear()
+            metrics_to_write, self.metrics_buffer = self.metrics_buffer, []
 
-        try:
-            with open(self.output_file, "a") as f:
-                for metric in metrics_to_write:
-                    f.write(json.dumps(metric) + "\n")
-        except Exception as e:
-            print(f"Failed to write metrics: {e}", file=sys.stderr)
+        retry = self._write_batch(
+            self.output_file, metrics_to_write, self._serialize_metric, "metric"
+        )
+        if retry:
             # Put metrics back in buffer for retry
             with self.buffer_lock:
-                self.metrics_buffer.extend(metrics_to_write)
+                self.metrics_buffer.extend(retry)
+
+    def _flush_alerts(self):
+        """Flush alerts buffer to file"""
+        if not self.alerts_buffer:
+            return
+
+        with self.buffer_lock:
+            alerts_to_write, self.alerts_buffer = self.alerts_buffer, []
+
+        retry = self._write_batch(
+            self.alerts_file, alerts_to_write, self._serialize_alert, "alert"
+        )
+        if retry:
+            # Put alerts back in buffer for retry
+            with self.buffer_lock:
+                self.alerts_buffer.extend(retry)
+
+    def _write_batch(self, path: str, items: list, serialize, kind: str) -> list:
+        """Serialize buffered items and append them to path
+
+        Items are serialized one at a time and any that fail are dropped with
+        a message, so a single bad entry cannot block the rest. Returns the
+        serialized items if the write itself fails, for the caller to retry.
+        """
+        lines = []
+        written = []
+        for item in items:
+            try:
+                lines.append(serialize(item))
+            except Exception as e:
+                print(f"Dropping {kind} that cannot be written: {e}", file=sys.stderr)
+                continue
+            written.append(item)
+
+        if not lines:
+            return []
+
+        try:
+            self._append(path, "\n".join(lines) + "\n")
+        except Exception as e:
+            print(f"Failed to write {kind}s: {e}", file=sys.stderr)
+            return written
+        return []
+
+    def _append(self, path: str, payload: str):
+        """Append payload to path through a long-lived file handle
+
+        After close() the file is opened for this write only, so nothing is
+        left open.
+        """
+        if self._stop.is_set():
+            with self.file_lock, open(path, "a") as f:
+                f.write(payload)
+            return
+
+        with self.file_lock:
+            fh = self._file_handles.get(path)
+            if fh is not None:
+                # Reopen if the file was rotated or removed since it was opened
+                try:
+                    rotated = os.fstat(fh.fileno()).st_ino != os.stat(path).st_ino
+                except OSError:
+                    rotated = True
+                if rotated:
+                    del self._file_handles[path]
+                    fh.close()
+                    fh = None
+
+            if fh is None:
+                fh = self._file_handles[path] = open(path, "a")
+
+            try:
+                fh.write(payload)
+                fh.flush()
+            except Exception:
+                # Drop the handle so the next attempt starts from a fresh open
+                del self._file_handles[path]
+                fh.close()
+                raise
+
+    def close(self):
+        """Stop the flush thread, write remaining data and close output files
+
+        Data emitted after close() is written immediately.
+        """
+        self._stop.set()
+        _open_clients.discard(self)
+
+        # The flush thread itself may drop the last reference to the client
+        thread = self.flush_thread
+        if thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=10)
+        self.flush()
+
+        with self.file_lock:
+            for fh in self._file_handles.values():
+                fh.close()
+            self._file_handles.clear()
+
+    def __del__(self):
+        # Unclosed clients write their buffers when garbage collected
+        if hasattr(self, "flush_thread") and not self._stop.is_set():
+            self.close()
+
+    @staticmethod
+    def _serialize_metric(metric: Dict[str, Any]) -> str:
+        """Serialize a buffered metric, rendering its timestamp in ISO format"""
+        timestamp = datetime.fromtimestamp(metric["timestamp"] / 1e9, _UTC)
+        return json.dumps({**metric, "timestamp": timestamp.isoformat()})
+
+    @staticmethod
+    def _serialize_alert(alert: tuple) -> str:
+        """Serialize a buffered (timestamp_ns, alert_type, data) alert"""
+        timestamp_ns, alert_type, alert_data = alert
+        timestamp = datetime.fromtimestamp(timestamp_ns / 1e9, _UTC)
+        return json.dumps(
+            {
+                "timestamp": timestamp.isoformat(),
+                "alert_type": alert_type,
+                "data": alert_data,
+                "source": "claude-friends-templates",
+            }
+        )
 
 
 # Global metrics client instance
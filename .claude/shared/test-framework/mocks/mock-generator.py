@@ -6,42 +6,81 @@ This utility helps generate mock objects and test doubles for various testing sc
 """
 
 import json
+import os
 import random
 import string
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union, Type
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, Type
 import uuid
 
+# Seconds a formatted "now" timestamp is reused before it is rebuilt
+TIMESTAMP_REFRESH_INTERVAL = 0.5
+
+# Characters used for random strings
+STRING_CHARS = string.ascii_letters + string.digits
+
+# Value pools used by DatabaseMockGenerator
+FIRST_NAMES = ["John", "Jane", "Bob", "Alice", "Charlie"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones"]
+PRODUCT_CATEGORIES = ["Electronics", "Clothing", "Books", "Food", "Other"]
+ORDER_STATUSES = ["pending", "processing", "shipped", "delivered", "cancelled"]
+
+
+def _timestamp_entry(now: float) -> Tuple[float, str]:
+    """Pair epoch seconds with their local ISO format."""
+    return now, datetime.fromtimestamp(now).isoformat()
+
+
+# Last (epoch seconds, ISO timestamp) returned by _iso_now; replaced as a
+# whole so concurrent callers never see a time paired with another's string
+_now_cache = _timestamp_entry(time.time())
+
+
+def _iso_now() -> str:
+    """Return the current local time in ISO format, cached briefly between calls."""
+    global _now_cache
+    cached = _now_cache
+    now = time.time()
+    if now - cached[0] > TIMESTAMP_REFRESH_INTERVAL:
+        cached = _now_cache = _timestamp_entry(now)
+    return cached[1]
+
 
 class MockGenerator:
     """Base class for generating mock data."""
 
     def __init__(self, seed: Optional[int] = None):
         """Initialize the generator with optional seed for reproducibility."""
-        if seed:
-            random.seed(seed)
+        # Each generator owns its random state, so generators can be used
+        # from separate threads without sharing the module-level state.
+        # Without a seed it is seeded from the module-level state, so
+        # random.seed() still makes unseeded generators reproducible
+        if seed is None:
+            seed = random.getrandbits(64)
+        self._rng = random.Random(seed)
 
     # Basic data generators
     def string(self, length: int = 10, prefix: str = "") -> str:
         """Generate a random string."""
-        chars = string.ascii_letters + string.digits
-        result = "".join(random.choice(chars) for _ in range(length))
+        result = "".join(self._rng.choices(STRING_CHARS, k=length))
         return f"{prefix}{result}" if prefix else result
 
     def integer(self, min_val: int = 0, max_val: int = 100) -> int:
         """Generate a random integer."""
-        return random.randint(min_val, max_val)
+        return self._rng.randint(min_val, max_val)
 
     def float(
         self, min_val: float = 0.0, max_val: float = 100.0, decimals: int = 2
     ) -> float:
         """Generate a random float."""
-        result = random.uniform(min_val, max_val)
+        result = self._rng.uniform(min_val, max_val)
         return round(result, decimals)
 
     def boolean(self, true_probability: float = 0.5) -> bool:
         """Generate a random boolean."""
-        return random.random() < true_probability
+        return self._rng.random() < true_probability
 
     def uuid(self) -> str:
         """Generate a UUID."""
@@ -54,10 +93,8 @@ class MockGenerator:
 
     def phone(self, format: str = "+1-XXX-XXX-XXXX") -> str:
         """Generate a random phone number."""
-        result = format
-        for _ in range(format.count("X")):
-            result = result.replace("X", str(random.randint(0, 9)), 1)
-        return result
+        digits = iter(self._rng.choices(string.digits, k=format.count("X")))
+        return "".join(next(digits) if char == "X" else char for char in format)
 
     def date(
         self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
@@ -70,12 +107,12 @@ class MockGenerator:
 
         time_between = end_date - start_date
         days_between = time_between.days
-        random_days = random.randrange(days_between)
+        random_days = self._rng.randrange(days_between)
         return start_date + timedelta(days=random_days)
 
     def choice(self, choices: List[Any]) -> Any:
         """Select a random item from a list."""
-        return random.choice(choices)
+        return self._rng.choice(choices)
 
     def subset(
         self, items: List[Any], min_size: int = 1, max_size: Optional[int] = None
@@ -83,101 +120,187 @@ class MockGenerator:
         """Select a random subset from a list."""
         if max_size is None:
             max_size = len(items)
-        size = random.randint(min_size, min(max_size, len(items)))
-        return random.sample(items, size)
+        size = self._rng.randint(min_size, min(max_size, len(items)))
+        return self._rng.sample(items, size)
+
+    # Bulk generators, drawing the values for many records in one call
+    def strings(self, count: int, length: int = 10, prefix: str = "") -> List[str]:
+        """Generate several random strings."""
+        chars = self._rng.choices(STRING_CHARS, k=count * length)
+        return [
+            prefix + "".join(chars[start : start + length])
+            for start in range(0, count * length, length)
+        ]
+
+    def uuids(self, count: int) -> List[str]:
+        """Generate several UUIDs from a single read of random bytes."""
+        data = bytearray(os.urandom(16 * count))
+        # Set the version 4 and RFC 4122 variant bits of every UUID
+        data[6::16] = bytes(byte & 0x0F | 0x40 for byte in data[6::16])
+        data[8::16] = bytes(byte & 0x3F | 0x80 for byte in data[8::16])
+
+        hex_data = data.hex()
+        return [
+            f"{hex_data[start : start + 8]}-{hex_data[start + 8 : start + 12]}-"
+            f"{hex_data[start + 12 : start + 16]}-{hex_data[start + 16 : start + 20]}-"
+            f"{hex_data[start + 20 : start + 32]}"
+            for start in range(0, 32 * count, 32)
+        ]
+
+    def integers(self, count: int, min_val: int = 0, max_val: int = 100) -> List[int]:
+        """Generate several random integers."""
+        randint = self._rng.randint
+        return [randint(min_val, max_val) for _ in range(count)]
+
+    def floats(
+        self,
+        count: int,
+        min_val: float = 0.0,
+        max_val: float = 100.0,
+        decimals: int = 2,
+    ) -> List[float]:
+        """Generate several random floats."""
+        uniform = self._rng.uniform
+        return [round(uniform(min_val, max_val), decimals) for _ in range(count)]
+
+    def booleans(self, count: int, true_probability: float = 0.5) -> List[bool]:
+        """Generate several random booleans."""
+        draw = self._rng.random
+        return [draw() < true_probability for _ in range(count)]
+
+    def dates(
+        self,
+        count: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[datetime]:
+        """Generate several random dates between start and end."""
+        if not start_date:
+            start_date = datetime.now() - timedelta(days=365)
+        if not end_date:
+            end_date = datetime.now()
+
+        days_between = (end_date - start_date).days
+        if days_between <= 0:
+            # Same error as date() raises for an empty range
+            raise ValueError(f"empty date range: {start_date} to {end_date}")
+        randrange = self._rng.randrange
+        return [
+            start_date + timedelta(days=randrange(days_between)) for _ in range(count)
+        ]
 
 
 class ObjectMockGenerator(MockGenerator):
     """Generate mock objects based on schemas."""
 
+    # Generator method for each simple type name
+    _TYPE_GENERATORS = {
+        "string": "string",
+        "int": "integer",
+        "integer": "integer",
+        "float": "float",
+        "bool": "boolean",
+        "boolean": "boolean",
+        "uuid": "uuid",
+        "email": "email",
+        "date": "_iso_date",
+    }
+
     def from_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Generate mock object from a schema definition."""
-        result = {}
-
+        return self.from_compiled(self.compile_schema(schema))
+
+    def _iso_date(self) -> str:
+        """Generate a random date as an ISO string."""
+        return self.date().isoformat()
+
+    # Compiled schemas: the field definitions are interpreted once, leaving a
+    # list of (field name, generator) pairs to call for each object. This is
+    # the only place field definitions are interpreted; from_schema compiles
+    # and runs a plan for a single object.
+    def compile_schema(
+        self, schema: Dict[str, Any]
+    ) -> List[Tuple[str, Callable[[], Any]]]:
+        """Compile a schema into generators for repeated object generation."""
+        plan = []
         for field, field_def in schema.items():
             if isinstance(field_def, dict):
-                result[field] = self._generate_field(field_def)
+                plan.append((field, self._compile_field(field_def)))
             else:
-                # Simple type definition
-                result[field] = self._generate_by_type(field_def)
+                plan.append((field, self._compile_type(field_def)))
+        return plan
 
-        return result
+    def from_compiled(
+        self, plan: List[Tuple[str, Callable[[], Any]]]
+    ) -> Dict[str, Any]:
+        """Generate a mock object from a compiled schema."""
+        return {field: generate() for field, generate in plan}
 
-    def _generate_field(self, field_def: Dict[str, Any]) -> Any:
-        """Generate a field value based on its definition."""
+    def _compile_field(self, field_def: Dict[str, Any]) -> Callable[[], Any]:
+        """Compile a field definition into a generator."""
         field_type = field_def.get("type", "string")
 
         if field_type == "string":
-            return self._generate_string_field(field_def)
+            if "pattern" in field_def:
+                # The pattern is not honoured yet; generate a plain string
+                # TODO: Implement regex-based generation
+                return partial(self.string, field_def.get("length", 10))
+            elif "enum" in field_def:
+                return partial(self.choice, field_def["enum"])
+            return partial(
+                self.string, field_def.get("length", 10), field_def.get("prefix", "")
+            )
         elif field_type == "integer":
-            return self.integer(field_def.get("min", 0), field_def.get("max", 100))
+            return partial(
+                self.integer, field_def.get("min", 0), field_def.get("max", 100)
+            )
         elif field_type == "float":
-            return self.float(
+            return partial(
+                self.float,
                 field_def.get("min", 0.0),
                 field_def.get("max", 100.0),
                 field_def.get("decimals", 2),
             )
         elif field_type == "boolean":
-            return self.boolean(field_def.get("true_probability", 0.5))
+            return partial(self.boolean, field_def.get("true_probability", 0.5))
         elif field_type == "array":
-            return self._generate_array_field(field_def)
+            return self._compile_array_field(field_def)
         elif field_type == "object":
-            return self.from_schema(field_def.get("properties", {}))
+            return partial(
+                self.from_compiled,
+                self.compile_schema(field_def.get("properties", {})),
+            )
         elif field_type == "date":
-            return self.date().isoformat()
+            return self._iso_date
         elif field_type == "email":
-            return self.email(field_def.get("domain", "example.com"))
+            return partial(self.email, field_def.get("domain", "example.com"))
         elif field_type == "uuid":
-            return self.uuid()
+            return self.uuid
         elif field_type == "choice":
-            return self.choice(field_def.get("choices", []))
-
-        return None
-
-    def _generate_string_field(self, field_def: Dict[str, Any]) -> str:
-        """Generate a string field with constraints."""
-        if "pattern" in field_def:
-            # For now, return a simple string
-            # TODO: Implement regex-based generation
-            return self.string(field_def.get("length", 10))
-        elif "enum" in field_def:
-            return self.choice(field_def["enum"])
-        else:
-            return self.string(field_def.get("length", 10), field_def.get("prefix", ""))
+            return partial(self.choice, field_def.get("choices", []))
 
-    def _generate_array_field(self, field_def: Dict[str, Any]) -> List[Any]:
-        """Generate an array field."""
+        return lambda: None
+
+    def _compile_array_field(self, field_def: Dict[str, Any]) -> Callable[[], Any]:
+        """Compile an array field definition into a generator."""
         min_items = field_def.get("min_items", 1)
         max_items = field_def.get("max_items", 5)
-        item_count = random.randint(min_items, max_items)
-
-        items = []
         item_def = field_def.get("items", {"type": "string"})
+        if isinstance(item_def, dict):
+            generate_item = self._compile_field(item_def)
+        else:
+            generate_item = self._compile_type(item_def)
 
-        for _ in range(item_count):
-            if isinstance(item_def, dict):
-                items.append(self._generate_field(item_def))
-            else:
-                items.append(self._generate_by_type(item_def))
-
-        return items
-
-    def _generate_by_type(self, type_name: str) -> Any:
-        """Generate value by simple type name."""
-        generators = {
-            "string": lambda: self.string(),
-            "int": lambda: self.integer(),
-            "integer": lambda: self.integer(),
-            "float": lambda: self.float(),
-            "bool": lambda: self.boolean(),
-            "boolean": lambda: self.boolean(),
-            "uuid": lambda: self.uuid(),
-            "email": lambda: self.email(),
-            "date": lambda: self.date().isoformat(),
-        }
+        def generate_array() -> List[Any]:
+            item_count = self._rng.randint(min_items, max_items)
+            return [generate_item() for _ in range(item_count)]
+
+        return generate_array
 
-        generator = generators.get(type_name, lambda: None)
-        return generator()
+    def _compile_type(self, type_name: str) -> Callable[[], Any]:
+        """Compile a simple type name into a generator."""
+        method_name = self._TYPE_GENERATORS.get(type_name)
+        return getattr(self, method_name) if method_name else lambda: None
 
 
 class APIResponseMockGenerator(ObjectMockGenerator):
@@ -192,7 +315,7 @@ class APIResponseMockGenerator(ObjectMockGenerator):
             "code": 200,
             "message": message,
             "data": data or {},
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
         }
 
     def error_response(
@@ -207,7 +330,7 @@ class APIResponseMockGenerator(ObjectMockGenerator):
             "code": status_code,
             "error_code": error_code,
             "message": message,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
         }
 
     def paginated_response(
@@ -235,7 +358,7 @@ class APIResponseMockGenerator(ObjectMockGenerator):
                     "has_prev": page > 1,
                 },
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
         }
 
 
@@ -248,13 +371,11 @@ class DatabaseMockGenerator(ObjectMockGenerator):
             "id": self.uuid(),
             "username": self.string(8, prefix="user_"),
             "email": self.email(),
-            "first_name": self.choice(["John", "Jane", "Bob", "Alice", "Charlie"]),
-            "last_name": self.choice(
-                ["Smith", "Johnson", "Williams", "Brown", "Jones"]
-            ),
+            "first_name": self.choice(FIRST_NAMES),
+            "last_name": self.choice(LAST_NAMES),
             "is_active": self.boolean(0.9),
             "created_at": self.date().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "updated_at": _iso_now(),
         }
         base.update(overrides)
         return base
@@ -267,12 +388,10 @@ class DatabaseMockGenerator(ObjectMockGenerator):
             "description": f"Description for {self.string(10)}",
             "price": self.float(10.0, 1000.0),
             "stock": self.integer(0, 100),
-            "category": self.choice(
-                ["Electronics", "Clothing", "Books", "Food", "Other"]
-            ),
+            "category": self.choice(PRODUCT_CATEGORIES),
             "is_available": self.boolean(0.8),
             "created_at": self.date().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "updated_at": _iso_now(),
         }
         base.update(overrides)
         return base
@@ -283,17 +402,100 @@ class DatabaseMockGenerator(ObjectMockGenerator):
             "id": self.uuid(),
             "user_id": user_id or self.uuid(),
             "order_number": f"ORD-{self.integer(10000, 99999)}",
-            "status": self.choice(
-                ["pending", "processing", "shipped", "delivered", "cancelled"]
-            ),
+            "status": self.choice(ORDER_STATUSES),
             "total": self.float(10.0, 1000.0),
             "items_count": self.integer(1, 10),
             "created_at": self.date().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "updated_at": _iso_now(),
         }
         base.update(overrides)
         return base
 
+    def users_bulk(self, count: int, **overrides) -> List[Dict[str, Any]]:
+        """Generate many mock user records, drawing each field in bulk."""
+        ids = self.uuids(count)
+        usernames = self.strings(count, 8, prefix="user_")
+        emails = self.strings(count, 8, prefix="user_")
+        first_names = self._rng.choices(FIRST_NAMES, k=count)
+        last_names = self._rng.choices(LAST_NAMES, k=count)
+        is_active = self.booleans(count, 0.9)
+        created_at = self.dates(count)
+        updated_at = _iso_now()
+
+        users = []
+        for i in range(count):
+            user = {
+                "id": ids[i],
+                "username": usernames[i],
+                "email": f"{emails[i]}@example.com",
+                "first_name": first_names[i],
+                "last_name": last_names[i],
+                "is_active": is_active[i],
+                "created_at": created_at[i].isoformat(),
+                "updated_at": updated_at,
+            }
+            user.update(overrides)
+            users.append(user)
+        return users
+
+    def products_bulk(self, count: int, **overrides) -> List[Dict[str, Any]]:
+        """Generate many mock product records, drawing each field in bulk."""
+        ids = self.uuids(count)
+        names = self.strings(count, 5)
+        descriptions = self.strings(count, 10)
+        prices = self.floats(count, 10.0, 1000.0)
+        stock = self.integers(count, 0, 100)
+        categories = self._rng.choices(PRODUCT_CATEGORIES, k=count)
+        is_available = self.booleans(count, 0.8)
+        created_at = self.dates(count)
+        updated_at = _iso_now()
+
+        products = []
+        for i in range(count):
+            product = {
+                "id": ids[i],
+                "name": f"Product {names[i]}",
+                "description": f"Description for {descriptions[i]}",
+                "price": prices[i],
+                "stock": stock[i],
+                "category": categories[i],
+                "is_available": is_available[i],
+                "created_at": created_at[i].isoformat(),
+                "updated_at": updated_at,
+            }
+            product.update(overrides)
+            products.append(product)
+        return products
+
+    def orders_bulk(
+        self, count: int, user_id: Optional[str] = None, **overrides
+    ) -> List[Dict[str, Any]]:
+        """Generate many mock order records, drawing each field in bulk."""
+        ids = self.uuids(count)
+        user_ids = [user_id] * count if user_id else self.uuids(count)
+        order_numbers = self.integers(count, 10000, 99999)
+        statuses = self._rng.choices(ORDER_STATUSES, k=count)
+        totals = self.floats(count, 10.0, 1000.0)
+        items_counts = self.integers(count, 1, 10)
+        created_at = self.dates(count)
+        updated_at = _iso_now()
+
+        orders = []
+        for i in range(count):
+            order = {
+                "id": ids[i],
+                "user_id": user_ids[i],
+                "order_number": f"ORD-{order_numbers[i]}",
+                "status": statuses[i],
+                "total": totals[i],
+                "items_count": items_counts[i],
+                "created_at": created_at[i].isoformat(),
+                "updated_at": updated_at,
+            }
+            order.update(overrides)
+            orders.append(order)
+        return orders
+
 
 class ServiceMockGenerator:
     """Generate mock services and dependencies."""
@@ -311,9 +513,7 @@ class ServiceMockGenerator:
             def __getattr__(self, name):
                 def mock_method(*args, **kwargs):
                     # Track calls
-                    if name not in self.call_count:
-                        self.call_count[name] = 0
-                    self.call_count[name] += 1
+                    self.call_count[name] = self.call_count.get(name, 0) + 1
 
                     # Raise exception if configured
                     if name in self.exceptions:
@@ -326,6 +526,8 @@ class ServiceMockGenerator:
                     # Default returns
                     return {"status": "mocked", "method": name}
 
+                # Cache on the instance so later lookups bypass __getattr__
+                object.__setattr__(self, name, mock_method)
                 return mock_method
 
             def configure_return(self, method_name: str, return_value: Any):
@@ -349,7 +551,7 @@ class ServiceMockGenerator:
 def generate_users(count: int = 10) -> List[Dict[str, Any]]:
     """Generate multiple mock users."""
     generator = DatabaseMockGenerator()
-    return [generator.user() for _ in range(count)]
+    return generator.users_bulk(count)
 
 
 def generate_api_response(success: bool = True, data: Any = None) -> Dict[str, Any]:
@@ -366,7 +568,8 @@ def generate_from_schema(
 ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
     """Generate mock objects from a schema."""
     generator = ObjectMockGenerator()
-    results = [generator.from_schema(schema) for _ in range(count)]
+    plan = generator.compile_schema(schema)
+    results = [generator.from_compiled(plan) for _ in range(count)]
     return results[0] if count == 1 else results
 
 
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for all Claude test suites
+
+Provides:
+- --runslow: Opt-in flag for tests marked @pytest.mark.slow
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Register the --runslow command line option"""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --runslow is given"""
+    if config.getoption("--runslow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
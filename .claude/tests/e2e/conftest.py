@@ -5,19 +5,84 @@ Task 2.5.4 - Green Phase
 
 Provides:
 - claude_workspace: Fully isolated test workspace with automatic script setup
+- Script path fixtures (agent_switch_sh, builder_startup_sh, handover_generator_py)
+- as_builder: Switches CLAUDE_AGENT to builder for a test
+- writable_claude_dir: .claude/ directory with permissions restored afterwards
 - Automatic cleanup after tests
 - Environment variable management
 """
 
 import os
 import shutil
+import stat
 from pathlib import Path
 
 import pytest
 
+# Source of the scripts installed into every workspace
+SCRIPTS_SRC = Path(__file__).parent.parent.parent / "scripts"
+
+# Only top-level scripts are installed into the workspace
+SCRIPT_SUFFIXES = (".py", ".sh")
+
+
+@pytest.fixture(scope="session")
+def _claude_scripts_cache(tmp_path_factory):
+    """
+    Copy of .claude/scripts/ shared by every workspace of the session
+
+    Python and Bash scripts (Bash scripts made executable) are copied once
+    into the session's temp directory, so each xdist worker has its own copy
+    and every session starts from the current scripts.
+
+    Returns:
+        Path: Directory holding the prepared scripts
+    """
+    cache_dir = tmp_path_factory.mktemp("claude_scripts")
+    if not SCRIPTS_SRC.exists():
+        return cache_dir
+
+    with os.scandir(SCRIPTS_SRC) as it:
+        for entry in it:
+            if not entry.is_file() or not entry.name.endswith(SCRIPT_SUFFIXES):
+                continue
+            dest = cache_dir / entry.name
+            shutil.copy(entry.path, dest)
+            if entry.name.endswith(".sh"):
+                dest.chmod(0o755)  # Make executable
+
+    return cache_dir
+
+
+@pytest.fixture(scope="session")
+def _claude_skeleton(tmp_path_factory):
+    """
+    Session-wide .claude/ directory skeleton copied into every workspace
+
+    Returns:
+        Path: Prepared .claude/ directory (without scripts)
+    """
+    claude_dir = tmp_path_factory.mktemp("claude_skeleton") / ".claude"
+
+    # Create subdirectories
+    (claude_dir / "agents" / "planner").mkdir(parents=True)
+    (claude_dir / "agents" / "builder").mkdir(parents=True)
+    (claude_dir / "logs").mkdir()
+    (claude_dir / "states").mkdir()
+    (claude_dir / "shared").mkdir()  # For shared files like phase-todo.md
+
+    # Create initial agent notes
+    planner_notes = claude_dir / "agents" / "planner" / "notes.md"
+    planner_notes.write_text("# Planner Notes\n\n## Current Task: Test\n")
+
+    builder_notes = claude_dir / "agents" / "builder" / "notes.md"
+    builder_notes.write_text("# Builder Notes\n\n## Current Task: Test\n")
+
+    return claude_dir
+
 
 @pytest.fixture(scope="function")
-def claude_workspace(tmp_path):
+def claude_workspace(tmp_path, _claude_skeleton, _claude_scripts_cache, monkeypatch):
     """
     Fully isolated Claude workspace with all scripts pre-installed
 
@@ -30,6 +95,9 @@ def claude_workspace(tmp_path):
 
     Args:
         tmp_path: pytest tmp_path fixture (temporary directory)
+        _claude_skeleton: Session-scoped .claude/ directory skeleton
+        _claude_scripts_cache: Cached copy of .claude/scripts/
+        monkeypatch: pytest monkeypatch fixture (restores environment variables)
 
     Returns:
         Path: Workspace root directory
@@ -43,50 +111,55 @@ def claude_workspace(tmp_path):
     workspace = tmp_path / "test_workspace"
     workspace.mkdir()
 
-    # Create .claude directory structure
+    # Create .claude directory structure and agent notes from the skeleton
+    # (copied, not linked, since tests may edit the notes)
     claude_dir = workspace / ".claude"
-    claude_dir.mkdir()
+    shutil.copytree(_claude_skeleton, claude_dir)
 
-    # Create subdirectories
-    (claude_dir / "agents" / "planner").mkdir(parents=True)
-    (claude_dir / "agents" / "builder").mkdir(parents=True)
-    (claude_dir / "scripts").mkdir()
-    (claude_dir / "logs").mkdir()
-    (claude_dir / "states").mkdir()
-    (claude_dir / "shared").mkdir()  # For shared files like phase-todo.md
+    # Automatic script installation from the session-wide cache
+    # Each workspace gets its own copies, so tests may edit them freely
+    shutil.copytree(_claude_scripts_cache, claude_dir / "scripts")
 
-    # Create initial agent notes
-    planner_notes = claude_dir / "agents" / "planner" / "notes.md"
-    planner_notes.write_text("# Planner Notes\n\n## Current Task: Test\n")
+    # Set environment variables for test isolation
+    # monkeypatch restores them after the test, even if it fails
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(workspace))
+    monkeypatch.setenv("CLAUDE_AGENT", "planner")
 
-    builder_notes = claude_dir / "agents" / "builder" / "notes.md"
-    builder_notes.write_text("# Builder Notes\n\n## Current Task: Test\n")
+    yield workspace
 
-    # Automatic script copying from .claude/scripts/
-    # This eliminates manual shutil.copy() in every test
-    scripts_src = Path(__file__).parent.parent.parent / "scripts"
 
-    if scripts_src.exists():
-        # Copy Python scripts
-        for script_file in scripts_src.glob("*.py"):
-            dest = claude_dir / "scripts" / script_file.name
-            shutil.copy(script_file, dest)
+@pytest.fixture
+def agent_switch_sh(claude_workspace):
+    """Path to agent-switch.sh inside the workspace"""
+    return claude_workspace / ".claude" / "scripts" / "agent-switch.sh"
 
-        # Copy Bash scripts and make executable
-        for script_file in scripts_src.glob("*.sh"):
-            dest = claude_dir / "scripts" / script_file.name
-            shutil.copy(script_file, dest)
-            dest.chmod(0o755)  # Make executable
 
-    # Set environment variables for test isolation
-    os.environ["CLAUDE_PROJECT_DIR"] = str(workspace)
-    os.environ["CLAUDE_AGENT"] = "planner"
+@pytest.fixture
+def builder_startup_sh(claude_workspace):
+    """Path to builder-startup.sh inside the workspace"""
+    return claude_workspace / ".claude" / "scripts" / "builder-startup.sh"
 
-    # Yield workspace to test
-    yield workspace
 
-    # Automatic cleanup
-    if "CLAUDE_PROJECT_DIR" in os.environ:
-        del os.environ["CLAUDE_PROJECT_DIR"]
-    if "CLAUDE_AGENT" in os.environ:
-        del os.environ["CLAUDE_AGENT"]
+@pytest.fixture
+def handover_generator_py(claude_workspace):
+    """Path to handover-generator.py inside the workspace"""
+    return claude_workspace / ".claude" / "scripts" / "handover-generator.py"
+
+
+@pytest.fixture
+def as_builder(claude_workspace, monkeypatch):
+    """Run the test as the builder agent (claude_workspace defaults to planner)"""
+    monkeypatch.setenv("CLAUDE_AGENT", "builder")
+
+
+@pytest.fixture
+def writable_claude_dir(claude_workspace):
+    """
+    Workspace .claude/ directory that tests may make read-only
+
+    Full owner permissions are restored in the finalizer, even if the test
+    fails, so pytest can clean up the workspace.
+    """
+    claude_dir = claude_workspace / ".claude"
+    yield claude_dir
+    claude_dir.chmod(stat.S_IRWXU)
@@ -24,6 +24,9 @@ import sys
 from pathlib import Path
 from typing import Any
 
+# Loaded modules keyed by (module name, resolved script path, mtime_ns)
+_MODULE_CACHE: dict[tuple[str, str, int], Any] = {}
+
 
 def load_script_module(script_path: Path, module_name: str) -> Any:
     """
@@ -32,6 +35,9 @@ def load_script_module(script_path: Path, module_name: str) -> Any:
     Python's import system converts hyphens to underscores, causing
     ModuleNotFoundError for files like "handover-generator.py".
     This function uses importlib.util to load such files directly.
+    Modules are cached per module name, resolved path and modification
+    time, so reloading an unchanged script under the same name within a
+    workspace returns the same module object.
 
     Args:
         script_path: Path to .py file (can contain hyphens)
@@ -52,6 +58,17 @@ def load_script_module(script_path: Path, module_name: str) -> Any:
     if not script_path.exists():
         raise FileNotFoundError(f"Script not found: {script_path}")
 
+    key = (
+        module_name,
+        str(script_path.resolve()),
+        script_path.stat().st_mtime_ns,
+    )
+    cached = _MODULE_CACHE.get(key)
+    if cached is not None:
+        # Another path may have been loaded under this name since
+        sys.modules[module_name] = cached
+        return cached
+
     # Create module spec from file location
     spec = importlib.util.spec_from_file_location(module_name, script_path)
 
@@ -61,36 +78,44 @@ def load_script_module(script_path: Path, module_name: str) -> Any:
     # Create module from spec
     module = importlib.util.module_from_spec(spec)
 
-    # Register module in sys.modules for caching
+    # Register module in sys.modules before executing it, replacing any
+    # module loaded from an older version of the script
     sys.modules[module_name] = module
 
     # Execute module (load code)
-    spec.loader.exec_module(module)
-
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Like the import system, don't leave a half-initialized module behind
+        if sys.modules.get(module_name) is module:
+            del sys.modules[module_name]
+        raise
+
+    _MODULE_CACHE[key] = module
     return module
 
 
-# Pre-load commonly used modules for convenience
-_COMMON_MODULES = {}
+# Convenience getters for commonly used modules (cached by load_script_module)
+# Missing scripts are not cached, so a getter finds a script created later
+
+
+def _load_common_module(cwd: Path, script_name: str, module_name: str) -> Any:
+    """Load .claude/scripts/<script_name> relative to cwd, or None if missing"""
+    script_path = cwd / ".claude" / "scripts" / script_name
+    if not script_path.exists():
+        return None
+    return load_script_module(script_path, module_name)
 
 
 def get_handover_generator_module():
     """Get handover-generator module (cached)"""
-    if "handover_generator" not in _COMMON_MODULES:
-        script_path = Path(".claude/scripts/handover-generator.py")
-        if script_path.exists():
-            _COMMON_MODULES["handover_generator"] = load_script_module(
-                script_path, "handover_generator"
-            )
-    return _COMMON_MODULES.get("handover_generator")
+    return _load_common_module(
+        Path.cwd(), "handover-generator.py", "handover_generator"
+    )
 
 
 def get_state_synchronizer_module():
     """Get state_synchronizer module (cached)"""
-    if "state_synchronizer" not in _COMMON_MODULES:
-        script_path = Path(".claude/scripts/state_synchronizer.py")
-        if script_path.exists():
-            _COMMON_MODULES["state_synchronizer"] = load_script_module(
-                script_path, "state_synchronizer"
-            )
-    return _COMMON_MODULES.get("state_synchronizer")
+    return _load_common_module(
+        Path.cwd(), "state_synchronizer.py", "state_synchronizer"
+    )
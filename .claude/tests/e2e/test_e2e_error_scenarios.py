@@ -8,13 +8,32 @@ Test Framework: pytest
 Target: Task 2.5.1 - E2E Integration Test Suite
 """
 
-import json
 import os
+import shutil
 import subprocess
 import stat
-from pathlib import Path
 
 import pytest
+from script_loader import load_script_module
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+# Scripts under test finish well under a second; fail fast if one hangs
+SUBPROCESS_TIMEOUT = 2
+
+
+def _run(*args, **kwargs):
+    """subprocess.run with a short default timeout, in its own session"""
+    kwargs.setdefault("timeout", SUBPROCESS_TIMEOUT)
+    kwargs.setdefault("start_new_session", True)
+    return subprocess.run(*args, **kwargs)
 
 
 # claude_workspace fixture removed - now using claude_workspace from conftest.py
@@ -25,25 +44,23 @@ class TestErrorScenarios:
     """Test Suite C: Error handling and recovery"""
 
     @pytest.mark.e2e
-    def test_missing_handover_file_graceful_fallback(self, claude_workspace):
+    @pytest.mark.usefixtures("as_builder")
+    def test_missing_handover_file_graceful_fallback(
+        self, claude_workspace, builder_startup_sh
+    ):
         """
         Test 1: Missing handover file triggers graceful fallback
 
         Expected: FAIL (fallback not implemented)
         """
-        # Arrange: No handover files exist
-        os.environ["CLAUDE_AGENT"] = "builder"
+        # Arrange: No handover files exist (running as builder)
 
         # Act: Attempt to load handover with startup script
-        result = subprocess.run(
-            [
-                "bash",
-                str(claude_workspace / ".claude" / "scripts" / "builder-startup.sh"),
-            ],
+        result = _run(
+            ["bash", str(builder_startup_sh)],
             cwd=claude_workspace,
             capture_output=True,
             text=True,
-            timeout=10,
         )
 
         # Assert: Graceful fallback (no crash, reads notes.md instead)
@@ -58,7 +75,9 @@ class TestErrorScenarios:
         ), "Should fall back to notes.md"
 
     @pytest.mark.e2e
-    def test_corrupted_handover_json_recovery(self, claude_workspace):
+    def test_corrupted_handover_json_recovery(
+        self, claude_workspace, handover_generator_py
+    ):
         """
         Test 2: Corrupted JSON handover file triggers recovery
 
@@ -70,23 +89,11 @@ class TestErrorScenarios:
             '{"metadata": {"invalid JSON syntax'
         )  # Intentional corruption
 
-        os.environ["CLAUDE_AGENT"] = "planner"
-
         # Act: Attempt to process handover (using script_loader)
-        import sys
+        handover_gen = load_script_module(handover_generator_py, "handover_generator")
 
-        test_dir = Path(__file__).parent
-        sys.path.insert(0, str(test_dir))
-
-        from script_loader import load_script_module
-
-        handover_gen_script = (
-            claude_workspace / ".claude" / "scripts" / "handover-generator.py"
-        )
-        handover_gen = load_script_module(handover_gen_script, "handover_generator")
-
-        # HandoverGenerator() doesn't take arguments - it reads CLAUDE_PROJECT_DIR from env
-        os.environ["CLAUDE_PROJECT_DIR"] = str(claude_workspace)
+        # HandoverGenerator() doesn't take arguments - it reads
+        # CLAUDE_PROJECT_DIR from env (set by claude_workspace)
         gen = handover_gen.HandoverGenerator()
         error_handled = False
         try:
@@ -108,47 +115,37 @@ class TestErrorScenarios:
         assert "Error handled" in result.stdout, "Exception not handled gracefully"
 
     @pytest.mark.e2e
-    def test_permission_denied_on_handover_directory(self, claude_workspace):
+    def test_permission_denied_on_handover_directory(
+        self, claude_workspace, writable_claude_dir, agent_switch_sh
+    ):
         """
         Test 3: Permission errors are handled gracefully
 
         Expected: FAIL (permission error handling not implemented)
         """
         # Arrange: Make handover directory read-only
-        claude_dir = claude_workspace / ".claude"
-        claude_dir.chmod(stat.S_IRUSR | stat.S_IXUSR)  # r-x------
+        # (writable_claude_dir restores permissions after the test)
+        writable_claude_dir.chmod(stat.S_IRUSR | stat.S_IXUSR)  # r-x------
 
-        os.environ["CLAUDE_AGENT"] = "planner"
-
-        try:
-            # Act: Attempt to create handover
-            result = subprocess.run(
-                [
-                    "bash",
-                    str(claude_workspace / ".claude" / "scripts" / "agent-switch.sh"),
-                    "planner",
-                    "builder",
-                ],
-                cwd=claude_workspace,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            # Assert: Permission error reported gracefully
-            assert result.returncode != 0, "Should fail with permission error"
-            # Error message can be in stdout (JSON output) or stderr
-            combined_output = result.stdout + result.stderr
-            assert (
-                "Permission denied" in combined_output
-                or "cannot create" in combined_output.lower()
-            ), f"Permission error not reported. stdout={result.stdout}, stderr={result.stderr}"
+        # Act: Attempt to create handover
+        result = _run(
+            ["bash", str(agent_switch_sh), "planner", "builder"],
+            cwd=claude_workspace,
+            capture_output=True,
+            text=True,
+        )
 
-        finally:
-            # Cleanup: Restore permissions
-            claude_dir.chmod(stat.S_IRWXU)
+        # Assert: Permission error reported gracefully
+        assert result.returncode != 0, "Should fail with permission error"
+        # Error message can be in stdout (JSON output) or stderr
+        combined_output = result.stdout + result.stderr
+        assert (
+            "Permission denied" in combined_output
+            or "cannot create" in combined_output.lower()
+        ), f"Permission error not reported. stdout={result.stdout}, stderr={result.stderr}"
 
     @pytest.mark.e2e
+    @pytest.mark.usefixtures("as_builder")
     def test_handover_timeout_handling(self, claude_workspace):
         """
         Test 4: Handover generation timeout is handled
@@ -158,20 +155,18 @@ class TestErrorScenarios:
         # Arrange: Create script that simulates slow operation
         slow_script = claude_workspace / ".claude" / "scripts" / "slow-handover.sh"
         slow_script.write_text("""#!/bin/bash
-sleep 60  # Simulate very slow handover
+sleep 0.5  # Simulate slow handover (well past the timeout below)
 """)
         slow_script.chmod(stat.S_IRWXU)
 
-        os.environ["CLAUDE_AGENT"] = "builder"
-
         # Act: Run with timeout
         try:
-            result = subprocess.run(
+            result = _run(
                 ["bash", str(slow_script)],
                 cwd=claude_workspace,
                 capture_output=True,
                 text=True,
-                timeout=5,  # 5 second timeout
+                timeout=0.1,  # Trip the timeout path without a long wait
             )
             pytest.fail("Should have timed out")
 
@@ -182,44 +177,65 @@ sleep 60  # Simulate very slow handover
         # Assert: Check if timeout is logged
         log_file = claude_workspace / ".claude" / "logs" / "handover.log"
         if log_file.exists():
-            log_content = log_file.read_text()
-            assert (
-                "timeout" in log_content.lower() or "timed out" in log_content.lower()
-            )
+            log_content = log_file.read_text().lower()
+            assert any(token in log_content for token in ("timeout", "timed out"))
 
     @pytest.mark.e2e
-    def test_concurrent_handover_prevention(self, claude_workspace):
+    @pytest.mark.parametrize(
+        "agent, switch_args, locked, expected_errors",
+        [
+            # Test 5: Concurrent handover attempts are prevented (file locking)
+            (
+                "builder",
+                ("builder", "planner"),
+                True,
+                ("lock", "already in progress"),
+            ),
+            # Test 7: Invalid agent names are rejected
+            (
+                "planner",
+                ("planner", "invalid_agent"),
+                False,
+                ("invalid", "unknown agent"),
+            ),
+        ],
+        ids=["concurrent_handover_prevention", "invalid_agent_name"],
+    )
+    def test_agent_switch_rejected(
+        self,
+        claude_workspace,
+        agent_switch_sh,
+        monkeypatch,
+        agent,
+        switch_args,
+        locked,
+        expected_errors,
+    ):
         """
-        Test 5: Concurrent handover attempts are prevented (file locking)
+        Tests 5 & 7: agent-switch.sh refuses handovers it cannot perform
 
-        Expected: FAIL (locking not implemented)
+        Expected: FAIL (locking / validation not implemented)
         """
-        # Arrange: Create handover lock file
-        lock_file = claude_workspace / ".claude" / ".handover.lock"
-        lock_file.write_text(f"locked_by=planner\npid={os.getpid()}\n")
-
-        os.environ["CLAUDE_AGENT"] = "builder"
-
-        # Act: Attempt concurrent handover
-        result = subprocess.run(
-            [
-                "bash",
-                str(claude_workspace / ".claude" / "scripts" / "agent-switch.sh"),
-                "builder",
-                "planner",
-            ],
+        # Arrange: Optionally hold the handover lock
+        monkeypatch.setenv("CLAUDE_AGENT", agent)
+        if locked:
+            lock_file = claude_workspace / ".claude" / ".handover.lock"
+            lock_file.write_text(f"locked_by=planner\npid={os.getpid()}\n")
+
+        # Act: Attempt handover
+        result = _run(
+            ["bash", str(agent_switch_sh), *switch_args],
             cwd=claude_workspace,
             capture_output=True,
             text=True,
-            timeout=10,
         )
 
-        # Assert: Concurrent operation blocked
-        assert result.returncode != 0, "Should fail with lock error"
-        assert (
-            "lock" in result.stderr.lower()
-            or "already in progress" in result.stderr.lower()
-        ), "Lock not enforced"
+        # Assert: Handover rejected with a matching error
+        assert result.returncode != 0, "Handover should have been rejected"
+        stderr = result.stderr.lower()
+        assert any(
+            error in stderr for error in expected_errors
+        ), f"Expected one of {expected_errors} in stderr: {result.stderr}"
 
     @pytest.mark.e2e
     def test_disk_full_error_handling(self, claude_workspace):
@@ -231,77 +247,17 @@ sleep 60  # Simulate very slow handover
         # Note: This is a simulation test - actual disk full condition is hard to test
         # We'll test if the script checks available space
 
-        # Arrange: Create handover generator with disk check
-        os.environ["CLAUDE_AGENT"] = "planner"
-
-        # Act: Check if disk space is validated before write
-        result = subprocess.run(
-            [
-                "python3",
-                "-c",
-                f"""
-import sys
-import shutil
-sys.path.insert(0, '{claude_workspace / '.claude' / 'scripts'}')
-
-# Check if scripts validate disk space
-free_space = shutil.disk_usage('{claude_workspace}').free
-print(f'Free space: {{free_space}} bytes')
-
-# Expect at least 10MB free for handover
-if free_space < 10 * 1024 * 1024:
-    print('ERROR: Insufficient disk space')
-    sys.exit(1)
-
-print('Disk space validated')
-""",
-            ],
-            cwd=claude_workspace,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-
-        # Assert: Disk space check performed
-        assert "Free space:" in result.stdout
-        assert (
-            "Disk space validated" in result.stdout
-            or "Insufficient disk space" in result.stdout
-        )
-
-    @pytest.mark.e2e
-    def test_invalid_agent_name_error(self, claude_workspace):
-        """
-        Test 7: Invalid agent names are rejected
+        # Act: Check available space before write
+        free_space = shutil.disk_usage(claude_workspace).free
 
-        Expected: FAIL (validation not implemented)
-        """
-        # Arrange
-        os.environ["CLAUDE_AGENT"] = "planner"
-
-        # Act: Attempt handover with invalid agent name
-        result = subprocess.run(
-            [
-                "bash",
-                str(claude_workspace / ".claude" / "scripts" / "agent-switch.sh"),
-                "planner",
-                "invalid_agent",
-            ],
-            cwd=claude_workspace,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        # Assert: Invalid agent name rejected
-        assert result.returncode != 0, "Should reject invalid agent name"
+        # Assert: Expect at least 10MB free for handover
         assert (
-            "invalid" in result.stderr.lower()
-            or "unknown agent" in result.stderr.lower()
-        ), "Invalid agent not detected"
+            free_space > 10 * 1024 * 1024
+        ), f"Insufficient disk space: {free_space} bytes"
 
     @pytest.mark.e2e
-    def test_git_command_failure_fallback(self, claude_workspace):
+    @pytest.mark.usefixtures("as_builder")
+    def test_git_command_failure_fallback(self, claude_workspace, agent_switch_sh):
         """
         Test 8: Git command failures don't block handover
 
@@ -311,24 +267,15 @@ print('Disk space validated')
         # Ensure no .git directory exists
         git_dir = claude_workspace / ".git"
         if git_dir.exists():
-            import shutil
-
             shutil.rmtree(git_dir)
 
-        os.environ["CLAUDE_AGENT"] = "builder"
-
         # Act: Generate handover (git status will fail)
-        result = subprocess.run(
-            [
-                "bash",
-                str(claude_workspace / ".claude" / "scripts" / "agent-switch.sh"),
-                "builder",
-                "planner",
-            ],
+        result = _run(
+            ["bash", str(agent_switch_sh), "builder", "planner"],
             cwd=claude_workspace,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=5,  # Handover generation does the most work here
         )
 
         # Assert: Handover succeeds despite git failure
@@ -341,8 +288,7 @@ print('Disk space validated')
         assert len(handover_files) > 0, "Handover file not created"
 
         # Check git_status field shows error or N/A
-        with open(handover_files[-1]) as f:
-            handover_data = json.load(f)
+        handover_data = _json_loads(handover_files[-1].read_bytes())
 
         if "context" in handover_data and "git_status" in handover_data["context"]:
             git_status = handover_data["context"]["git_status"]
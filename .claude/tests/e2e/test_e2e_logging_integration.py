@@ -11,10 +11,135 @@ Python: 3.12+
 
 import json
 import os
+import shutil
 import subprocess
 import time
+from itertools import islice
 
 import pytest
+from scripts.ai_logger import AIOptimizedLogger
+from scripts.error_pattern_learning import LogAnalyzer
+from scripts.log_analysis_tool import ReportGenerator
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj):
+        """Serialize to JSON bytes (stdlib fallback for orjson.dumps)"""
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+
+def _read_jsonl(log_file):
+    """Parse a JSONL file in one read, skipping blank lines"""
+    return [
+        _json_loads(line) for line in log_file.read_bytes().split(b"\n") if line.strip()
+    ]
+
+
+def agent_of(entry):
+    """Agent recorded in a log entry's context, or None if there is none"""
+    context = entry.get("context")
+    return context.get("agent") if context else None
+
+
+# Resolve bash once instead of searching PATH on every subprocess call
+BASH = shutil.which("bash") or "bash"
+
+
+# Pre-serialized JSONL lines for the large fixtures; only the varying fields
+# are substituted per entry
+ROTATION_LOG_LINE = (
+    '{"timestamp":"2025-09-30T10:00:%02d+00:00","level":"INFO",'
+    '"message":"Entry %d: %s","logger":"test",'
+    '"context":{},"metadata":{},"ai_metadata":{}}\n'
+)
+LARGE_LOG_LINE = (
+    '{"timestamp":"2025-09-30T%s+00:00","level":"%s",'
+    '"message":"Entry %d: Operation completed","logger":"test",'
+    '"context":{"agent":"%s"},"metadata":{"operation":"op_%d"},'
+    '"ai_metadata":{"priority":"normal"}}\n'
+)
+
+
+@pytest.fixture(scope="session")
+def rotation_log_file(tmp_path_factory):
+    """1,000 entries with 1KB messages (~1MB), shared by read-only tests"""
+    log_file = tmp_path_factory.mktemp("logs") / "rotation.jsonl"
+
+    # Write many entries to exceed typical rotation threshold (e.g., 10MB)
+    large_message = "A" * 1000  # 1KB message
+    log_file.write_text(
+        "".join(
+            ROTATION_LOG_LINE % (i % 60, i, large_message)
+            for i in range(1000)  # 1MB total
+        )
+    )
+    return log_file
+
+
+@pytest.fixture(scope="session")
+def large_log_file(tmp_path_factory):
+    """10,000 mixed INFO/ERROR entries, shared by read-only tests"""
+    log_file = tmp_path_factory.mktemp("logs") / "large.jsonl"
+
+    # One clock time per entry, one second apart from midnight, generated by
+    # nested loops instead of dividing the entry index for every field
+    clock_times = islice(
+        (
+            f"{hour:02d}:{minute:02d}:{second:02d}"
+            for hour in range(24)
+            for minute in range(60)
+            for second in range(60)
+        ),
+        10000,
+    )
+
+    # Assemble the whole file in memory and write it with a single call
+    content = "".join(
+        LARGE_LOG_LINE
+        % (
+            clock_time,
+            "ERROR" if i % 10 == 0 else "INFO",
+            i,
+            "planner" if i % 2 == 0 else "builder",
+            i % 5,
+        )
+        for i, clock_time in enumerate(clock_times)
+    )
+    log_file.write_text(content)
+    return log_file
+
+
+@pytest.fixture
+def run_switch(claude_workspace, tmp_path):
+    """
+    Run agent-switch.sh in the workspace, logging to a per-test AI log file
+
+    Returns a function run_switch(src, dst, agent=None) that switches as agent
+    (src by default) and returns (result, log_file).
+    """
+    agent_switch_sh = claude_workspace / ".claude" / "scripts" / "agent-switch.sh"
+    log_file = tmp_path / "ai-activity.jsonl"
+
+    def _run_switch(src, dst, agent=None):
+        env = {**os.environ, "AI_LOG_FILE": str(log_file), "CLAUDE_AGENT": agent or src}
+        result = subprocess.run(
+            [BASH, str(agent_switch_sh), src, dst],
+            cwd=claude_workspace,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        return result, log_file
+
+    return _run_switch
 
 
 class TestLoggingSystemIntegration:
@@ -22,40 +147,20 @@ class TestLoggingSystemIntegration:
 
     @pytest.mark.e2e
     @pytest.mark.integration
-    def test_agent_switch_creates_log_entries(self, claude_workspace, tmp_path):
+    def test_agent_switch_creates_log_entries(self, run_switch):
         """
         Test 1: Agent switch generates structured log entries
 
         Expected: FAIL (AI logger not integrated with agent-switch.sh)
         """
-        # Arrange: Set up AI logger with custom log file
-        log_file = tmp_path / "ai-activity.jsonl"
-        os.environ["AI_LOG_FILE"] = str(log_file)
-        os.environ["CLAUDE_AGENT"] = "planner"
-
-        # Act: Trigger agent switch
-        result = subprocess.run(
-            [
-                "bash",
-                str(claude_workspace / ".claude" / "scripts" / "agent-switch.sh"),
-                "planner",
-                "builder",
-            ],
-            cwd=claude_workspace,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        # Act: Trigger agent switch (AI logger writes to a custom log file)
+        result, log_file = run_switch("planner", "builder")
 
         # Assert: Log entries created
         assert log_file.exists(), "AI log file not created"
 
         # Read log entries
-        log_entries = []
-        with open(log_file) as f:
-            for line in f:
-                if line.strip():
-                    log_entries.append(json.loads(line))
+        log_entries = _read_jsonl(log_file)
 
         assert len(log_entries) > 0, "No log entries created"
 
@@ -71,35 +176,18 @@ class TestLoggingSystemIntegration:
 
     @pytest.mark.e2e
     @pytest.mark.integration
-    def test_handover_failure_generates_error_log(self, claude_workspace, tmp_path):
+    def test_handover_failure_generates_error_log(self, run_switch):
         """
         Test 2: Handover failure generates ERROR level log
 
         Expected: FAIL (error logging not implemented)
         """
-        # Arrange: Set up logger with invalid handover scenario
-        log_file = tmp_path / "ai-activity.jsonl"
-        os.environ["AI_LOG_FILE"] = str(log_file)
-        os.environ["CLAUDE_AGENT"] = "planner"
-
         # Simulate error by providing invalid arguments
-        result = subprocess.run(
-            [
-                "bash",
-                str(claude_workspace / ".claude" / "scripts" / "agent-switch.sh"),
-                "invalid_agent",
-                "builder",
-            ],
-            cwd=claude_workspace,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        result, log_file = run_switch("invalid_agent", "builder", agent="planner")
 
         # Assert: Error log created (even if script fails)
         if log_file.exists():
-            with open(log_file) as f:
-                log_entries = [json.loads(line) for line in f if line.strip()]
+            log_entries = _read_jsonl(log_file)
 
             # Find ERROR level logs
             error_logs = [e for e in log_entries if e.get("level") == "ERROR"]
@@ -124,7 +212,6 @@ class TestLoggingSystemIntegration:
         """
         # Arrange: Create log file with multiple similar errors
         log_file = tmp_path / "ai-activity.jsonl"
-        os.environ["AI_LOG_FILE"] = str(log_file)
 
         # Simulate multiple handovers with errors
         error_message = "Connection timeout during handover"
@@ -139,16 +226,10 @@ class TestLoggingSystemIntegration:
                 "metadata": {},
                 "ai_metadata": {"priority": "high", "requires_human_review": True},
             }
-            with open(log_file, "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
+            with open(log_file, "ab") as f:
+                f.write(_json_dumps(log_entry) + b"\n")
 
         # Act: Run error pattern learning
-        # Import after PATH setup
-        import sys
-
-        sys.path.insert(0, str(claude_workspace / ".claude" / "scripts"))
-        from error_pattern_learning import LogAnalyzer
-
         analyzer = LogAnalyzer(log_file)
         patterns = analyzer.analyze_patterns()
         insights = analyzer.generate_insights()
@@ -208,17 +289,9 @@ class TestLoggingSystemIntegration:
             },
         ]
 
-        with open(log_file, "w") as f:
-            for entry in log_entries:
-                f.write(json.dumps(entry) + "\n")
+        log_file.write_bytes(b"".join(_json_dumps(e) + b"\n" for e in log_entries))
 
         # Act: Generate analysis report
-        import sys
-
-        sys.path.insert(0, str(claude_workspace / ".claude" / "scripts"))
-        from error_pattern_learning import LogAnalyzer
-        from log_analysis_tool import ReportGenerator
-
         analyzer = LogAnalyzer(log_file)
         generator = ReportGenerator(analyzer)
         report = generator.generate_full_report()
@@ -241,91 +314,47 @@ class TestLoggingSystemIntegration:
 
     @pytest.mark.e2e
     @pytest.mark.integration
-    def test_complete_cycle_with_logging(self, claude_workspace, tmp_path):
+    @pytest.mark.slow
+    def test_complete_cycle_with_logging(self, run_switch):
         """
         Test 5: Complete cycle (Planner→Builder→Planner) with full logging
 
         Expected: FAIL (complete integration not tested)
         """
-        # Arrange: Set up logging
-        log_file = tmp_path / "ai-activity.jsonl"
-        os.environ["AI_LOG_FILE"] = str(log_file)
-        os.environ["CLAUDE_AGENT"] = "planner"
-
         # Phase 1: Planner → Builder
-        result1 = subprocess.run(
-            [
-                "bash",
-                str(claude_workspace / ".claude" / "scripts" / "agent-switch.sh"),
-                "planner",
-                "builder",
-            ],
-            cwd=claude_workspace,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        result1, log_file = run_switch("planner", "builder")
 
-        # Phase 2: Builder → Planner
-        os.environ["CLAUDE_AGENT"] = "builder"
-        result2 = subprocess.run(
-            [
-                "bash",
-                str(claude_workspace / ".claude" / "scripts" / "agent-switch.sh"),
-                "builder",
-                "planner",
-            ],
-            cwd=claude_workspace,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        # Phase 2: Builder → Planner (logs to the same file)
+        result2, _ = run_switch("builder", "planner")
 
         # Assert: Log file exists
         assert log_file.exists(), "Log file not created"
 
         # Assert: Log entries for both handovers
-        with open(log_file) as f:
-            log_entries = [json.loads(line) for line in f if line.strip()]
+        log_entries = _read_jsonl(log_file)
 
         assert len(log_entries) >= 2, "Insufficient log entries for complete cycle"
 
         # Verify correlation between handovers
-        planner_entries = [
-            e for e in log_entries if e.get("context", {}).get("agent") == "planner"
-        ]
-        builder_entries = [
-            e for e in log_entries if e.get("context", {}).get("agent") == "builder"
-        ]
+        planner_entries = [e for e in log_entries if agent_of(e) == "planner"]
+        builder_entries = [e for e in log_entries if agent_of(e) == "builder"]
 
         assert len(planner_entries) > 0, "No planner entries"
         assert len(builder_entries) > 0, "No builder entries"
 
     @pytest.mark.e2e
     @pytest.mark.integration
-    def test_log_file_rotation_on_large_volume(self, claude_workspace, tmp_path):
+    @pytest.mark.slow
+    def test_log_file_rotation_on_large_volume(
+        self, claude_workspace, rotation_log_file
+    ):
         """
         Test 6: Log file rotation when exceeding size limit
 
         Expected: FAIL (log rotation not implemented)
         """
-        # Arrange: Create large log file
-        log_file = tmp_path / "ai-activity.jsonl"
-
-        # Write many entries to exceed typical rotation threshold (e.g., 10MB)
-        large_message = "A" * 1000  # 1KB message
-        for i in range(1000):  # 1MB total
-            log_entry = {
-                "timestamp": f"2025-09-30T10:00:{i%60:02d}+00:00",
-                "level": "INFO",
-                "message": f"Entry {i}: {large_message}",
-                "logger": "test",
-                "context": {},
-                "metadata": {},
-                "ai_metadata": {},
-            }
-            with open(log_file, "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
+        # Arrange: Large log file shared across the session
+        log_file = rotation_log_file
 
         # Assert: Log file size check
         log_size_mb = log_file.stat().st_size / (1024 * 1024)
@@ -333,11 +362,6 @@ class TestLoggingSystemIntegration:
 
         # Note: Actual rotation behavior would be tested with logging config
         # For now, we verify file can be read and analyzed despite size
-        import sys
-
-        sys.path.insert(0, str(claude_workspace / ".claude" / "scripts"))
-        from error_pattern_learning import LogAnalyzer
-
         analyzer = LogAnalyzer(log_file)
         patterns = analyzer.analyze_patterns()
 
@@ -345,95 +369,64 @@ class TestLoggingSystemIntegration:
 
     @pytest.mark.e2e
     @pytest.mark.integration
+    @pytest.mark.parametrize(
+        "level, expected_priority",
+        [
+            ("DEBUG", "normal"),
+            ("INFO", "normal"),
+            ("WARNING", "normal"),
+            ("ERROR", "high"),
+            ("CRITICAL", "high"),
+        ],
+    )
     def test_ai_metadata_accuracy_for_different_log_levels(
-        self, claude_workspace, tmp_path
+        self, claude_workspace, tmp_path, monkeypatch, level, expected_priority
     ):
         """
         Test 7: AI metadata correctly assigned based on log level
 
         Expected: FAIL (AI metadata generation not fully implemented)
         """
-        # Arrange: Create logs with various levels
+        # Arrange: Logger writing into the test directory
         log_file = tmp_path / "ai-activity.jsonl"
-
-        levels_and_priorities = [
-            ("DEBUG", "normal"),
-            ("INFO", "normal"),
-            ("WARNING", "normal"),
-            ("ERROR", "high"),
-            ("CRITICAL", "high"),
-        ]
-
-        for level, expected_priority in levels_and_priorities:
-            log_entry = {
-                "timestamp": "2025-09-30T10:00:00+00:00",
-                "level": level,
-                "message": f"Test {level}",
-                "logger": "test",
-                "context": {},
-                "metadata": {},
-                "ai_metadata": {
-                    "priority": expected_priority,
-                    "requires_human_review": level in ["ERROR", "CRITICAL"],
-                },
-            }
-            with open(log_file, "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
-
-        # Act: Verify AI metadata
-        with open(log_file) as f:
-            entries = [json.loads(line) for line in f if line.strip()]
-
-        # Assert: All entries have correct AI metadata
-        for entry, (level, expected_priority) in zip(entries, levels_and_priorities, strict=False):
-            assert entry["level"] == level, f"Level mismatch for {level}"
-            assert (
-                entry["ai_metadata"]["priority"] == expected_priority
-            ), f"Priority mismatch for {level}"
-
-            if level in ["ERROR", "CRITICAL"]:
-                assert (
-                    entry["ai_metadata"]["requires_human_review"] is True
-                ), f"Should require human review for {level}"
-            else:
-                assert (
-                    entry["ai_metadata"]["requires_human_review"] is False
-                ), f"Should not require human review for {level}"
+        monkeypatch.setenv("AI_LOG_FILE", str(log_file))
+        logger = AIOptimizedLogger("test")
+        requires_review = level in ["ERROR", "CRITICAL"]
+
+        # Act: Log one message at this level
+        getattr(logger, level.lower())(f"Test {level}")
+
+        # Assert: The single logged entry has correct AI metadata
+        log_entries = _read_jsonl(log_file)
+        assert len(log_entries) == 1, f"Expected one log entry for {level}"
+        entry = log_entries[0]
+        assert entry["level"] == level, f"Level mismatch for {level}"
+        assert entry["message"] == f"Test {level}"
+        assert (
+            entry["ai_metadata"]["priority"] == expected_priority
+        ), f"Priority mismatch for {level}"
+        assert entry["ai_metadata"]["requires_human_review"] is requires_review, (
+            f"Should require human review for {level}"
+            if requires_review
+            else f"Should not require human review for {level}"
+        )
 
     @pytest.mark.e2e
     @pytest.mark.integration
     @pytest.mark.slow
     def test_performance_log_analysis_on_large_dataset(
-        self, claude_workspace, tmp_path
+        self, claude_workspace, large_log_file
     ):
         """
         Test 8: Log analysis performs well on large datasets
 
         Expected: FAIL (performance not optimized)
-        Target: Analyze 10,000 entries in <5 seconds
+        Target: Analyze 10,000 entries in <1 second
         """
-        # Arrange: Create large log dataset
-        log_file = tmp_path / "ai-activity.jsonl"
-
-        for i in range(10000):
-            log_entry = {
-                "timestamp": f"2025-09-30T{(i//3600)%24:02d}:{(i//60)%60:02d}:{i%60:02d}+00:00",
-                "level": "ERROR" if i % 10 == 0 else "INFO",
-                "message": f"Entry {i}: Operation completed",
-                "logger": "test",
-                "context": {"agent": "planner" if i % 2 == 0 else "builder"},
-                "metadata": {"operation": f"op_{i%5}"},
-                "ai_metadata": {"priority": "normal"},
-            }
-            with open(log_file, "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
+        # Arrange: Large log dataset shared across the session
+        log_file = large_log_file
 
         # Act: Measure analysis time
-        import sys
-
-        sys.path.insert(0, str(claude_workspace / ".claude" / "scripts"))
-        from error_pattern_learning import LogAnalyzer
-
         start_time = time.time()
         analyzer = LogAnalyzer(log_file)
         patterns = analyzer.analyze_patterns()
@@ -441,7 +434,7 @@ class TestLoggingSystemIntegration:
         elapsed_time = time.time() - start_time
 
         # Assert: Performance target
-        assert elapsed_time < 5.0, f"Analysis took {elapsed_time:.2f}s, expected <5s"
+        assert elapsed_time < 1.0, f"Analysis took {elapsed_time:.2f}s, expected <1s"
 
         # Assert: Analysis accuracy
         assert patterns["total_entries"] == 10000, "Should analyze all entries"
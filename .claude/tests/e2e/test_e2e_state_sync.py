@@ -11,9 +11,9 @@ Target: Task 2.5.1 - E2E Integration Test Suite
 import json
 import os
 import subprocess
-from pathlib import Path
 
 import pytest
+from script_loader import load_script_module
 
 # claude_workspace fixture removed - now using claude_workspace from conftest.py
 # This eliminates duplicate fixture code
@@ -142,13 +142,6 @@ class TestStateSynchronization:
         Expected: FAIL (checkpoint system not implemented)
         """
         # Use script_loader instead of subprocess to avoid JSON escaping issues
-        import sys
-
-        test_dir = Path(__file__).parent
-        sys.path.insert(0, str(test_dir))
-
-        from script_loader import load_script_module
-
         # Arrange: Create initial state
         state_file = claude_workspace / ".claude" / "state.json"
         initial_state = {
@@ -322,8 +315,9 @@ sync.update_state('{agent_id}', {{'value': {i}}})
 
         # Verify the handover includes task transition information
         # (the default is "Handover from X to Y" which shows task continuity)
-        assert (
-            "handover" in current_task.lower() or "task" in current_task.lower()
+        current_task_lower = current_task.lower()
+        assert any(
+            token in current_task_lower for token in ("handover", "task")
         ), f"currentTask should reference task information, got: {current_task}"
 
     @pytest.mark.e2e
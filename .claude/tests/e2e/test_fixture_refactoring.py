@@ -13,6 +13,7 @@ import subprocess
 from pathlib import Path
 
 import pytest
+from script_loader import load_script_module
 
 
 class TestSharedFixture:
@@ -85,26 +86,13 @@ class TestSharedFixture:
 
         Expected: FAIL (script_loader.py not created)
         """
-        # Import script_loader from test directory
-        import sys
+        script_path = claude_workspace / ".claude" / "scripts" / "handover-generator.py"
 
-        test_dir = Path(__file__).parent
-        sys.path.insert(0, str(test_dir))
+        # Should not raise ImportError
+        module = load_script_module(script_path, "handover_generator")
 
-        try:
-            from script_loader import load_script_module
-
-            script_path = (
-                claude_workspace / ".claude" / "scripts" / "handover-generator.py"
-            )
-
-            # Should not raise ImportError
-            module = load_script_module(script_path, "handover_generator")
-
-            # Verify module loaded
-            assert hasattr(module, "HandoverGenerator")
-        finally:
-            sys.path.remove(str(test_dir))
+        # Verify module loaded
+        assert hasattr(module, "HandoverGenerator")
 
     @pytest.mark.e2e
     def test_suite_b_uses_shared_fixture(self, claude_workspace):
@@ -118,32 +106,42 @@ class TestSharedFixture:
         assert sync_script.exists(), "state_synchronizer.py not copied"
 
         # Load module using script_loader
-        import sys
+        state_sync = load_script_module(sync_script, "state_synchronizer")
 
-        test_dir = Path(__file__).parent
-        sys.path.insert(0, str(test_dir))
+        # Create synchronizer
+        sync = state_sync.StateSynchronizer(
+            state_dir=str(claude_workspace / ".claude" / "states")
+        )
 
-        try:
-            from script_loader import load_script_module
+        # Test basic operation
+        result = sync.save_state("planner", {"test": "data"})
+        assert result["success"] == True
 
-            state_sync = load_script_module(sync_script, "state_synchronizer")
+        # Verify state file created
+        state_file = (
+            claude_workspace / ".claude" / "states" / "planner" / "current.json"
+        )
+        assert state_file.exists()
 
-            # Create synchronizer
-            sync = state_sync.StateSynchronizer(
-                state_dir=str(claude_workspace / ".claude" / "states")
-            )
+    @pytest.mark.e2e
+    def test_workspace_scripts_are_private_copies(
+        self, claude_workspace, _claude_scripts_cache
+    ):
+        """
+        Test 6: Workspace scripts are copies tests may edit without touching the cache
+        """
+        scripts_dir = claude_workspace / ".claude" / "scripts"
+        script = scripts_dir / "handover-generator.py"
+        cached = _claude_scripts_cache / "handover-generator.py"
+        original = cached.read_text()
 
-            # Test basic operation
-            result = sync.save_state("planner", {"test": "data"})
-            assert result["success"] == True
+        assert not os.path.samefile(script, cached)
+        assert os.access(scripts_dir / "agent-switch.sh", os.X_OK)
 
-            # Verify state file created
-            state_file = (
-                claude_workspace / ".claude" / "states" / "planner" / "current.json"
-            )
-            assert state_file.exists()
-        finally:
-            sys.path.remove(str(test_dir))
+        with open(script, "a") as f:
+            f.write("# edited by test\n")
+
+        assert cached.read_text() == original
 
 
 class TestFixtureCodeReduction:
@@ -231,6 +231,53 @@ class TestErrorPatternLearning:
             assert patterns["agent_activities"]["planner"] == 2
             assert patterns["agent_activities"]["builder"] == 1
 
+    def test_analyze_patterns_is_computed_once(self):
+        """Test that analyze_patterns() reuses its analysis across calls."""
+        from scripts.error_pattern_learning import LogAnalyzer
+
+        class UnreadableEntries(list):
+            def __iter__(self):
+                raise AssertionError("entries were analyzed again")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "test.jsonl"
+            log_path.write_text(
+                json.dumps({"level": "ERROR", "message": "Failed"}) + "\n"
+            )
+
+            analyzer = LogAnalyzer(log_path)
+            patterns = analyzer.analyze_patterns()
+            shared = analyzer._analyzed_patterns()
+
+            # A second analysis would have to iterate the entries again
+            analyzer.entries = UnreadableEntries(analyzer.entries)
+
+            assert analyzer._analyzed_patterns() is shared
+            assert analyzer.analyze_patterns() == patterns
+            assert analyzer.generate_insights() == [
+                "⚠️ High error rate detected: 100.0%"
+            ]
+            assert patterns["total_entries"] == 1
+
+    def test_analyze_patterns_result_can_be_modified(self):
+        """Test that modifying an analyze_patterns() result has no side effects."""
+        from scripts.error_pattern_learning import LogAnalyzer
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "test.jsonl"
+            log_path.write_text(
+                json.dumps({"level": "ERROR", "message": "Failed"}) + "\n"
+            )
+
+            analyzer = LogAnalyzer(log_path)
+            patterns = analyzer.analyze_patterns()
+            patterns["error_patterns"]["Failed"].clear()
+            patterns["agent_activities"]["planner"] = 99
+
+            fresh = analyzer.analyze_patterns()
+            assert len(fresh["error_patterns"]["Failed"]) == 1
+            assert "planner" not in fresh["agent_activities"]
+
     def test_generate_insights_detects_high_error_rate(self):
         """Test that generate_insights() detects high error rates (>10%)."""
         from scripts.error_pattern_learning import LogAnalyzer
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Metrics Collector Tests
+
+Test Coverage:
+- MetricsClient flush/close lifecycle and its background flush thread
+- Output file rotation and CLAUDE_METRICS_DISABLED
+- Handover and notes file caches shared by agent switch trackers
+"""
+
+import gc
+import importlib.util
+import json
+import os
+import threading
+import weakref
+from pathlib import Path
+
+import pytest
+
+# metrics-collector.py requires psutil
+pytest.importorskip("psutil")
+
+# metrics-collector.py is in .claude/shared/monitoring/
+monitoring_path = Path(__file__).parent.parent.parent / "shared" / "monitoring"
+
+spec = importlib.util.spec_from_file_location(
+    "metrics_collector", monitoring_path / "metrics-collector.py"
+)
+metrics_collector = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(metrics_collector)
+
+
+def read_jsonl(path):
+    """Entries of a JSON lines file, or [] if it does not exist"""
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def output_file(tmp_path):
+    return tmp_path / "metrics.jsonl"
+
+
+@pytest.fixture
+def alerts_file(tmp_path):
+    return tmp_path / "metrics-alerts.jsonl"
+
+
+@pytest.fixture
+def client(output_file):
+    client = metrics_collector.MetricsClient(str(output_file))
+    yield client
+    client.close()
+
+
+class TestMetricsClientLifecycle:
+    """Buffered data is written by flush() and close()"""
+
+    def test_flush_writes_buffered_metrics_and_alerts(
+        self, client, output_file, alerts_file
+    ):
+        """flush() writes everything emitted so far"""
+        client.emit_metric("test.metric", 3, {"tag": "a"})
+        client.emit_alert("test_alert", {"severity": "warning"})
+
+        client.flush()
+
+        metrics = read_jsonl(output_file)
+        alerts = read_jsonl(alerts_file)
+        assert [(m["metric"], m["value"], m["tags"]) for m in metrics] == [
+            ("test.metric", 3.0, {"tag": "a"})
+        ]
+        assert [(a["alert_type"], a["data"]) for a in alerts] == [
+            ("test_alert", {"severity": "warning"})
+        ]
+        assert client.metrics_buffer == []
+        assert client.alerts_buffer == []
+
+    def test_close_writes_buffered_metrics_and_alerts(
+        self, client, output_file, alerts_file
+    ):
+        """close() writes what the flush thread has not written yet"""
+        client.emit_metric("test.metric", 1)
+        client.emit_alert("test_alert", {"n": 1})
+
+        client.close()
+
+        assert [m["metric"] for m in read_jsonl(output_file)] == ["test.metric"]
+        assert [a["alert_type"] for a in read_jsonl(alerts_file)] == ["test_alert"]
+
+    def test_close_is_idempotent_and_joins_thread(self, client, output_file):
+        """close() stops the flush thread, and a second close() is harmless"""
+        client.emit_metric("test.metric", 1)
+
+        client.close()
+        assert not client.flush_thread.is_alive()
+        assert client._file_handles == {}
+
+        client.close()
+        assert len(read_jsonl(output_file)) == 1
+
+    def test_emit_after_close_writes_immediately(
+        self, client, output_file, alerts_file
+    ):
+        """With no flush thread left, emitted data is written straight away"""
+        client.close()
+
+        client.emit_metric("late.metric", 2)
+        client.emit_alert("late_alert", {})
+
+        assert [m["metric"] for m in read_jsonl(output_file)] == ["late.metric"]
+        assert [a["alert_type"] for a in read_jsonl(alerts_file)] == ["late_alert"]
+        assert client._file_handles == {}
+
+    def test_unreferenced_client_is_collected(self, output_file):
+        """The flush thread does not keep an unused client alive"""
+        client = metrics_collector.MetricsClient(str(output_file))
+        client.emit_metric("test.metric", 1)
+        thread = client.flush_thread
+        client_ref = weakref.ref(client)
+
+        del client
+        gc.collect()
+
+        assert client_ref() is None
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+        assert [m["metric"] for m in read_jsonl(output_file)] == ["test.metric"]
+
+    def test_rotated_file_is_reopened(self, client, output_file):
+        """Writes after a rotation go to a new file at the original path"""
+        client.emit_metric("before.rotation", 1)
+        client.flush()
+        rotated = output_file.with_name("metrics.jsonl.1")
+        os.rename(output_file, rotated)
+
+        client.emit_metric("after.rotation", 2)
+        client.flush()
+
+        assert [m["metric"] for m in read_jsonl(rotated)] == ["before.rotation"]
+        assert [m["metric"] for m in read_jsonl(output_file)] == ["after.rotation"]
+
+    def test_removed_file_is_recreated(self, client, output_file):
+        """Writes after the output file is deleted recreate it"""
+        client.emit_metric("first", 1)
+        client.flush()
+        output_file.unlink()
+
+        client.emit_metric("second", 2)
+        client.flush()
+
+        assert [m["metric"] for m in read_jsonl(output_file)] == ["second"]
+
+    def test_disabled_client_writes_nothing(
+        self, monkeypatch, output_file, alerts_file
+    ):
+        """CLAUDE_METRICS_DISABLED turns metrics and alerts off"""
+        monkeypatch.setenv("CLAUDE_METRICS_DISABLED", "1")
+        client = metrics_collector.MetricsClient(str(output_file))
+
+        client.emit_metric("test.metric", 1)
+        client.emit_alert("test_alert", {})
+        client.flush()
+        client.close()
+        client.emit_metric("late.metric", 1)
+
+        assert not output_file.exists()
+        assert not alerts_file.exists()
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Empty project directory with the file caches cleared"""
+    monkeypatch.chdir(tmp_path)
+    metrics_collector._handover_quality.cache_clear()
+    metrics_collector._notes_counts.cache_clear()
+    yield tmp_path
+    metrics_collector._handover_quality.cache_clear()
+    metrics_collector._notes_counts.cache_clear()
+
+
+def write_with_mtime(path, text, mtime_ns):
+    """Write a file and give it a fixed modification time"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestHandoverQualityCache:
+    """Handover quality is cached per file version, across trackers"""
+
+    HANDOVER = Path(".claude/shared/handover-interrupt-template.md")
+
+    def test_missing_handover(self, workspace, client):
+        """Without a handover file the size and quality are zero"""
+        tracker = metrics_collector.AgentSwitchPerformanceTracker(client)
+
+        assert tracker._analyze_handover_quality() == {"size": 0, "quality": 0.0}
+
+    def test_cache_is_shared_and_invalidated(self, workspace, client):
+        """Trackers share cached scores until the handover file changes"""
+        handover = workspace / self.HANDOVER
+        write_with_mtime(handover, "context status next priority", 10**18)
+
+        first = metrics_collector.AgentSwitchPerformanceTracker(client)
+        second = metrics_collector.AgentSwitchPerformanceTracker(client)
+        assert first._analyze_handover_quality()["quality"] == pytest.approx(0.5)
+        assert second._analyze_handover_quality()["quality"] == pytest.approx(0.5)
+        assert metrics_collector._handover_quality.cache_info().hits == 1
+
+        # Same size, newer modification time
+        write_with_mtime(handover, "context status none missing", 10**18 + 1)
+
+        result = second._analyze_handover_quality()
+        assert result["quality"] == pytest.approx(0.25)
+        assert result["size"] == handover.stat().st_size
+
+    def test_concurrent_lookups(self, workspace, client):
+        """Lookups from many threads over more files than the cache holds"""
+        paths = []
+        for index in range(40):
+            path = workspace / f"handover-{index}.md"
+            write_with_mtime(path, "context " * index, 10**18)
+            paths.append(str(path))
+
+        errors = []
+
+        def look_up():
+            try:
+                for _ in range(20):
+                    for path in paths:
+                        metrics_collector._handover_quality(path, 10**18, 0)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=look_up) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert metrics_collector._handover_quality.cache_info().currsize == 16
+
+
+class TestNotesMetricsCache:
+    """Agent notes metrics are cached per file version, across trackers"""
+
+    NOTES = Path(".claude/builder/notes.md")
+
+    def test_missing_notes(self, workspace, client):
+        """A missing notes file contributes no metrics"""
+        tracker = metrics_collector.AgentSwitchPerformanceTracker(client)
+
+        assert tracker._notes_metrics(str(self.NOTES)) == {}
+
+    def test_unchanged_notes_are_read_once(self, workspace, client):
+        """Trackers reuse the counts of an unchanged notes file"""
+        write_with_mtime(workspace / self.NOTES, "one two\nthree\n", 10**18)
+
+        results = [
+            metrics_collector.AgentSwitchPerformanceTracker(client)._notes_metrics(
+                str(self.NOTES)
+            )
+            for _ in range(3)
+        ]
+
+        assert results[0]["notes_lines"] == 2
+        assert results[0]["notes_words"] == 3
+        assert results[1] == results[0] == results[2]
+        cache_info = metrics_collector._notes_counts.cache_info()
+        assert (cache_info.misses, cache_info.hits) == (1, 2)
+
+    def test_rewritten_notes_update_metrics(self, workspace, client):
+        """Rewriting the notes file changes the reported metrics"""
+        notes = workspace / self.NOTES
+        tracker = metrics_collector.AgentSwitchPerformanceTracker(client)
+        write_with_mtime(notes, "alpha beta\n", 10**18)
+        before = tracker._analyze_pre_switch_context("builder")
+
+        # Same size, newer modification time
+        write_with_mtime(notes, "ab\nc\nd\ne\nf\n", 10**18 + 10**9)
+        after = tracker._analyze_pre_switch_context("builder")
+
+        assert (before["notes_lines"], before["notes_words"]) == (1, 2)
+        assert (after["notes_lines"], after["notes_words"]) == (5, 5)
+        assert after["notes_size"] == before["notes_size"]
+        assert after["notes_modified"] > before["notes_modified"]
+
+    def test_resized_notes_update_metrics(self, workspace, client):
+        """A size change is noticed even when the mtime is unchanged"""
+        notes = workspace / self.NOTES
+        tracker = metrics_collector.AgentSwitchPerformanceTracker(client)
+        write_with_mtime(notes, "alpha\n", 10**18)
+        assert tracker._notes_metrics(str(self.NOTES))["notes_words"] == 1
+
+        write_with_mtime(notes, "alpha beta gamma\n", 10**18)
+
+        metrics = tracker._notes_metrics(str(self.NOTES))
+        assert metrics["notes_words"] == 3
+        assert metrics["notes_size"] == notes.stat().st_size
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Mock Generator Tests
+
+Test Coverage:
+- Seeding of per-instance random state
+- Bulk scalar generators (strings, uuids, integers, floats, booleans, dates)
+- Bulk record generators (users_bulk, products_bulk, orders_bulk)
+- Compiled schemas (compile_schema/from_compiled) against from_schema
+- Cached ISO timestamps shared between threads
+"""
+
+import importlib.util
+import random
+import threading
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# mock-generator.py is in .claude/shared/test-framework/mocks/
+mocks_path = Path(__file__).parent.parent.parent / "shared" / "test-framework" / "mocks"
+
+spec = importlib.util.spec_from_file_location(
+    "mock_generator", mocks_path / "mock-generator.py"
+)
+mock_generator = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mock_generator)
+
+SEED = 1234
+
+
+class TestSeeding:
+    """Each generator draws from its own random state"""
+
+    def test_seeded_generators_are_independent_of_global_state(self):
+        """A seed fixes the values whatever the module-level state is"""
+        random.seed(1)
+        first = mock_generator.MockGenerator(SEED).integers(20)
+        random.seed(2)
+        second = mock_generator.MockGenerator(SEED).integers(20)
+
+        assert first == second
+
+    def test_unseeded_generators_follow_global_seed(self):
+        """random.seed() makes generators created without a seed reproducible"""
+        random.seed(SEED)
+        first = mock_generator.MockGenerator().strings(20)
+        random.seed(SEED)
+        second = mock_generator.MockGenerator().strings(20)
+
+        assert first == second
+        assert mock_generator.MockGenerator().strings(20) != first
+
+
+class TestBulkGenerators:
+    """Bulk generators return the same values as repeated scalar calls"""
+
+    def test_strings_match_scalar(self):
+        """strings() draws like repeated string() calls"""
+        bulk = mock_generator.MockGenerator(SEED).strings(20, 8, prefix="p_")
+        scalar = mock_generator.MockGenerator(SEED)
+
+        assert bulk == [scalar.string(8, prefix="p_") for _ in range(20)]
+        assert all(len(value) == 10 for value in bulk)
+
+    def test_integers_match_scalar(self):
+        """integers() draws like repeated integer() calls"""
+        bulk = mock_generator.MockGenerator(SEED).integers(50, 5, 9)
+        scalar = mock_generator.MockGenerator(SEED)
+
+        assert bulk == [scalar.integer(5, 9) for _ in range(50)]
+        assert all(5 <= value <= 9 for value in bulk)
+
+    def test_floats_match_scalar(self):
+        """floats() draws like repeated float() calls"""
+        bulk = mock_generator.MockGenerator(SEED).floats(50, 1.0, 2.0, 3)
+        scalar = mock_generator.MockGenerator(SEED)
+
+        assert bulk == [scalar.float(1.0, 2.0, 3) for _ in range(50)]
+
+    def test_booleans_match_scalar(self):
+        """booleans() draws like repeated boolean() calls"""
+        bulk = mock_generator.MockGenerator(SEED).booleans(50, 0.3)
+        scalar = mock_generator.MockGenerator(SEED)
+
+        assert bulk == [scalar.boolean(0.3) for _ in range(50)]
+
+    def test_dates_match_scalar(self):
+        """dates() draws like repeated date() calls"""
+        start = datetime(2025, 1, 1)
+        end = datetime(2025, 3, 1)
+        bulk = mock_generator.MockGenerator(SEED).dates(30, start, end)
+        scalar = mock_generator.MockGenerator(SEED)
+
+        assert bulk == [scalar.date(start, end) for _ in range(30)]
+        assert all(start <= value < end for value in bulk)
+
+    def test_uuids_are_distinct_version_4(self):
+        """uuids() returns well-formed, distinct version 4 UUIDs"""
+        values = mock_generator.MockGenerator(SEED).uuids(100)
+
+        assert len(set(values)) == 100
+        for value in values:
+            parsed = uuid.UUID(value)
+            assert str(parsed) == value
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
+    def test_zero_count_returns_empty_lists(self):
+        """A count of zero draws nothing"""
+        generator = mock_generator.MockGenerator(SEED)
+
+        assert generator.strings(0) == []
+        assert generator.uuids(0) == []
+        assert generator.integers(0) == []
+        assert generator.floats(0) == []
+        assert generator.booleans(0) == []
+        assert generator.dates(0) == []
+
+    @pytest.mark.parametrize("days", [0, -3])
+    def test_dates_empty_range_raises_like_date(self, days):
+        """dates() rejects an empty range with the ValueError date() raises"""
+        start = datetime(2025, 1, 10)
+        end = start + timedelta(days=days)
+        generator = mock_generator.MockGenerator(SEED)
+
+        with pytest.raises(ValueError):
+            generator.date(start, end)
+        with pytest.raises(ValueError, match="empty date range"):
+            generator.dates(5, start, end)
+
+
+class TestBulkRecords:
+    """users_bulk, products_bulk and orders_bulk"""
+
+    @pytest.fixture
+    def generator(self):
+        return mock_generator.DatabaseMockGenerator(SEED)
+
+    @pytest.mark.parametrize(
+        "bulk_method, scalar_method",
+        [
+            ("users_bulk", "user"),
+            ("products_bulk", "product"),
+            ("orders_bulk", "order"),
+        ],
+    )
+    def test_records_have_scalar_shape(self, generator, bulk_method, scalar_method):
+        """Bulk records have the fields and value types of scalar records"""
+        records = getattr(generator, bulk_method)(25)
+        reference = getattr(generator, scalar_method)()
+
+        assert len(records) == 25
+        assert len({record["id"] for record in records}) == 25
+        for record in records:
+            assert record.keys() == reference.keys()
+            for field, value in record.items():
+                assert type(value) is type(reference[field]), field
+
+    def test_users_bulk_values(self, generator):
+        """User fields are drawn from the same pools as user()"""
+        for user in generator.users_bulk(50):
+            assert user["username"].startswith("user_")
+            assert user["email"].endswith("@example.com")
+            assert user["first_name"] in mock_generator.FIRST_NAMES
+            assert user["last_name"] in mock_generator.LAST_NAMES
+            datetime.fromisoformat(user["created_at"])
+
+    def test_products_bulk_values(self, generator):
+        """Product fields respect the ranges used by product()"""
+        for product in generator.products_bulk(50):
+            assert product["name"].startswith("Product ")
+            assert 10.0 <= product["price"] <= 1000.0
+            assert 0 <= product["stock"] <= 100
+            assert product["category"] in mock_generator.PRODUCT_CATEGORIES
+
+    def test_orders_bulk_values(self, generator):
+        """Order fields respect the ranges used by order()"""
+        for order in generator.orders_bulk(50):
+            assert 10000 <= int(order["order_number"].removeprefix("ORD-")) <= 99999
+            assert order["status"] in mock_generator.ORDER_STATUSES
+            assert 1 <= order["items_count"] <= 10
+
+    def test_orders_bulk_shared_user_id(self, generator):
+        """A given user_id is used for every order"""
+        orders = generator.orders_bulk(10, user_id="user-1")
+
+        assert {order["user_id"] for order in orders} == {"user-1"}
+
+    @pytest.mark.parametrize("method", ["users_bulk", "products_bulk", "orders_bulk"])
+    def test_overrides_apply_to_every_record(self, generator, method):
+        """Keyword overrides replace and add fields on each record"""
+        records = getattr(generator, method)(10, id="fixed", extra=[1])
+
+        assert all(record["id"] == "fixed" for record in records)
+        assert all(record["extra"] == [1] for record in records)
+
+    def test_zero_count_returns_empty_list(self, generator):
+        """A count of zero returns no records"""
+        assert generator.users_bulk(0) == []
+        assert generator.products_bulk(0) == []
+        assert generator.orders_bulk(0) == []
+
+
+# Schema covering every field kind handled by compile_schema; uuid fields are
+# left out because UUIDs are not drawn from the seeded generator
+SCHEMA = {
+    "name": {"type": "string", "length": 12, "prefix": "n_"},
+    "code": {"type": "string", "pattern": r"^[A-Z]{3}$", "length": 6},
+    "level": {"type": "string", "enum": ["low", "mid", "high"]},
+    "age": {"type": "integer", "min": 18, "max": 80},
+    "score": {"type": "float", "min": 0.0, "max": 1.0, "decimals": 3},
+    "premium": {"type": "boolean", "true_probability": 0.3},
+    "email": {"type": "email", "domain": "test.org"},
+    "joined": {"type": "date"},
+    "role": {"type": "choice", "choices": ["admin", "user"]},
+    "count": "int",
+    "unknown": {"type": "nonexistent"},
+    "tags": {
+        "type": "array",
+        "min_items": 2,
+        "max_items": 4,
+        "items": {"type": "string", "enum": ["a", "b", "c"]},
+    },
+    "flags": {"type": "array", "min_items": 1, "max_items": 3, "items": "bool"},
+    "address": {
+        "type": "object",
+        "properties": {
+            "city": {"type": "string", "length": 5},
+            "zip": {"type": "integer", "min": 10000, "max": 99999},
+            "geo": {
+                "type": "object",
+                "properties": {
+                    "lat": {"type": "float", "min": -90.0, "max": 90.0},
+                    "history": {
+                        "type": "array",
+                        "max_items": 2,
+                        "items": {"type": "integer", "min": 1, "max": 3},
+                    },
+                },
+            },
+        },
+    },
+}
+
+
+class TestCompiledSchema:
+    """compile_schema/from_compiled generate what from_schema generates"""
+
+    def test_compiled_matches_from_schema(self):
+        """A reused compiled plan yields the same objects as from_schema"""
+        direct = mock_generator.ObjectMockGenerator(SEED)
+        compiled = mock_generator.ObjectMockGenerator(SEED)
+        plan = compiled.compile_schema(SCHEMA)
+
+        for _ in range(20):
+            expected = direct.from_schema(SCHEMA)
+            actual = compiled.from_compiled(plan)
+
+            # Dates are offsets from the current time; compare the day only
+            assert actual.pop("joined")[:10] == expected.pop("joined")[:10]
+            assert actual == expected
+
+    def test_generated_values_follow_schema(self):
+        """Nested objects, arrays, enums and formats follow their definitions"""
+        generator = mock_generator.ObjectMockGenerator(SEED)
+        plan = generator.compile_schema(SCHEMA)
+
+        for _ in range(20):
+            obj = generator.from_compiled(plan)
+
+            assert obj.keys() == SCHEMA.keys()
+            assert obj["name"].startswith("n_") and len(obj["name"]) == 14
+            assert obj["level"] in ("low", "mid", "high")
+            assert 18 <= obj["age"] <= 80
+            assert 0.0 <= obj["score"] <= 1.0
+            assert isinstance(obj["premium"], bool)
+            assert obj["email"].endswith("@test.org")
+            datetime.fromisoformat(obj["joined"])
+            assert obj["role"] in ("admin", "user")
+            assert 0 <= obj["count"] <= 100
+            assert obj["unknown"] is None
+            assert 2 <= len(obj["tags"]) <= 4
+            assert set(obj["tags"]) <= {"a", "b", "c"}
+            assert 1 <= len(obj["flags"]) <= 3
+            assert all(isinstance(flag, bool) for flag in obj["flags"])
+
+            address = obj["address"]
+            assert address.keys() == {"city", "zip", "geo"}
+            assert len(address["city"]) == 5
+            assert 10000 <= address["zip"] <= 99999
+            assert -90.0 <= address["geo"]["lat"] <= 90.0
+            assert 1 <= len(address["geo"]["history"]) <= 2
+            assert all(1 <= item <= 3 for item in address["geo"]["history"])
+
+    def test_pattern_is_not_honoured(self):
+        """String patterns are ignored; a plain string of the length is drawn"""
+        direct = mock_generator.ObjectMockGenerator(SEED)
+        compiled = mock_generator.ObjectMockGenerator(SEED)
+        schema = {"code": {"type": "string", "pattern": r"^\d+$", "length": 6}}
+        plan = compiled.compile_schema(schema)
+
+        values = [compiled.from_compiled(plan)["code"] for _ in range(20)]
+
+        assert values == [direct.from_schema(schema)["code"] for _ in range(20)]
+        assert all(len(value) == 6 for value in values)
+        assert not all(value.isdigit() for value in values)
+
+    def test_generate_from_schema_uses_one_plan(self):
+        """generate_from_schema returns one object, or a list for count > 1"""
+        single = mock_generator.generate_from_schema(SCHEMA)
+        many = mock_generator.generate_from_schema(SCHEMA, count=3)
+
+        assert single.keys() == SCHEMA.keys()
+        assert len(many) == 3
+        assert all(obj.keys() == SCHEMA.keys() for obj in many)
+
+
+class TestIsoNow:
+    """_iso_now reuses a formatted timestamp for a short interval"""
+
+    def test_cache_starts_with_a_timestamp(self):
+        """The cache holds a real timestamp before the first call"""
+        now, iso = mock_generator._now_cache
+
+        assert datetime.fromisoformat(iso) == datetime.fromtimestamp(now)
+
+    def test_concurrent_callers_get_consistent_timestamps(self, monkeypatch):
+        """Threads refreshing the cache never see a time without its string"""
+        monkeypatch.setattr(mock_generator, "TIMESTAMP_REFRESH_INTERVAL", -1.0)
+        results = []
+
+        def call():
+            for _ in range(500):
+                iso = mock_generator._iso_now()
+                now, cached_iso = mock_generator._now_cache
+                results.append(
+                    (iso, cached_iso == datetime.fromtimestamp(now).isoformat())
+                )
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 4000
+        for iso, consistent in results:
+            datetime.fromisoformat(iso)
+            assert consistent